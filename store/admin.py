@@ -10,6 +10,7 @@ import csv
 from .models import *
 from .emails import send_order_status_update_email
 from .admin_forms import EnhancedProductAdminForm
+from .utils import invalidate_pending_review_count, get_inventory_settings, update_product_rating_stats
 
 
 class ProductSpecificationInline(admin.TabularInline):
@@ -140,8 +141,7 @@ class ProductAdmin(admin.ModelAdmin):
     profit_margin.short_description = 'Est. Margin'
     
     def stock_status(self, obj):
-        from .inventory import inventory_manager
-        settings = inventory_manager.get_settings()
+        settings = get_inventory_settings()
         
         if obj.stock == 0:
             return format_html('<span style="color: red; font-weight: bold;">OUT OF STOCK</span>')
@@ -406,8 +406,14 @@ class ReviewAdmin(admin.ModelAdmin):
     actions = ['approve_reviews']
     
     def approve_reviews(self, request, queryset):
-        queryset.update(is_approved=True)
-        self.message_user(request, f'{queryset.count()} reviews approved.')
+        # Read the products first: once approved, the rows may no longer match
+        # the changelist filter (e.g. "is approved: No") the queryset came from
+        product_ids = list(queryset.values_list('product_id', flat=True).distinct())
+        updated = queryset.update(is_approved=True)
+        invalidate_pending_review_count()
+        # update() skips the Review signals, so refresh the product ratings here
+        update_product_rating_stats(product_ids)
+        self.message_user(request, f'{updated} reviews approved.')
     approve_reviews.short_description = 'Approve selected reviews'
 
 
@@ -637,7 +643,10 @@ class InventoryMovementAdmin(admin.ModelAdmin):
         writer.writerow(['Product', 'Movement Type', 'Quantity Change', 'Stock Before', 
                        'Stock After', 'Reference', 'Notes', 'Created By', 'Date'])
         
-        for movement in queryset:
+        # Stream rows with their product and user joined in, instead of
+        # caching every movement and querying both relations per row
+        movements = queryset.select_related('product', 'created_by').iterator(chunk_size=2000)
+        for movement in movements:
             writer.writerow([
                 movement.product.name,
                 movement.get_movement_type_display(),
@@ -670,17 +679,17 @@ class LowStockAlertAdmin(admin.ModelAdmin):
     mark_as_resolved.short_description = 'Mark selected alerts as resolved'
     
     def send_low_stock_alert(self, request, queryset):
-        from .emails import send_low_stock_alert_email
-        sent_count = 0
-        for alert in queryset:
-            try:
-                send_low_stock_alert_email(alert.product)
-                sent_count += 1
-            except Exception as e:
-                self.message_user(request, f'Error sending alert for {alert.product.name}: {e}', 
-                                 level=messages.ERROR)
+        from .tasks import run_in_background, send_low_stock_alerts_task
         
-        self.message_user(request, f'Sent {sent_count} low stock alert emails.')
+        # SMTP runs off the request thread; failures are logged per product
+        product_ids = list(queryset.values_list('product_id', flat=True).distinct())
+        run_in_background(send_low_stock_alerts_task, product_ids)
+        
+        self.message_user(
+            request,
+            f'{len(product_ids)} low stock alert emails queued for best-effort background delivery '
+            f'(not retried on failure or restart; check the error log).'
+        )
     send_low_stock_alert.short_description = 'Send email alerts'
 
 
@@ -906,7 +915,6 @@ class DiscountCouponAdmin(admin.ModelAdmin):
         """Set created_by when creating new coupon"""
         if not change:  # Creating new object
             obj.created_by = request.user
-        obj.coupon_code = obj.coupon_code.upper().strip()  # Normalize coupon code
         super().save_model(request, obj, form, change)
     
     def discount_display(self, obj):
@@ -975,8 +983,8 @@ class DiscountCouponAdmin(admin.ModelAdmin):
         writer.writerow(['Coupon Code', 'Type', 'Value', 'Status', 'Usage Count', 'Max Limit', 
                         'Min Order', 'Max Order', 'Expiration', 'Created'])
         
-        for coupon in queryset:
-            writer.writerow([
+        writer.writerows(
+            (
                 coupon.coupon_code,
                 coupon.get_discount_type_display(),
                 coupon.discount_value,
@@ -987,7 +995,9 @@ class DiscountCouponAdmin(admin.ModelAdmin):
                 coupon.maximum_order_amount or 'None',
                 coupon.expiration_date.strftime('%Y-%m-%d') if coupon.expiration_date else 'None',
                 coupon.created_at.strftime('%Y-%m-%d')
-            ])
+            )
+            for coupon in queryset
+        )
         
         return response
     export_coupon_stats.short_description = 'Export statistics to CSV'
@@ -640,9 +640,9 @@ class CurrencyConversionForm(forms.Form):
         
         return cleaned_data
     
-    def get_conversion_rate(self):
-        """Get current conversion rate"""
-        rates = get_exchange_rates()
+    def get_conversion_rate(self, rates=None):
+        """Get current conversion rate, reusing already-fetched rates if given"""
+        rates = rates or get_exchange_rates()
         from_currency = self.cleaned_data['from_currency']
         to_currency = self.cleaned_data['to_currency']
         
@@ -3,13 +3,16 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
 from django.http import JsonResponse, HttpResponse
+from django.db import transaction
 from django.db.models import Count, Avg, Sum, Q, F, Max, Min
+from django.db.models.functions import Greatest, Round, TruncMonth
 from django.utils import timezone
 from datetime import datetime, timedelta
 from decimal import Decimal
 from django.core.paginator import Paginator
 from django.forms import modelform_factory
-from django.core.mail import send_mail
+from django.core.mail import send_mail, get_connection, EmailMultiAlternatives
+from django.core.cache import cache
 from django.template.loader import render_to_string
 from django.conf import settings
 import json
@@ -18,11 +21,37 @@ import logging
 from .models import Product, Category, Order, OrderItem, Review, SearchQuery, DiscountCoupon, CouponUsage
 from django.contrib.auth.models import User
 from .admin_forms import EnhancedProductAdminForm, OrderManagementForm, ReviewModerationForm, CurrencyConversionForm
-from .context_processors import convert_price, get_exchange_rates
+from .context_processors import get_exchange_rates
+from .utils import get_pending_review_count, chunked, CUSTOMER_ANALYTICS_CACHE_KEY, INVOICE_CACHE_KEY
+from .tasks import (
+    run_in_background,
+    send_bulk_customer_email_task,
+    send_order_custom_email_task,
+    send_order_notification_task,
+)
 
 # Setup logger
 logger = logging.getLogger(__name__)
 
+# Exchange rates only change about once a day, so share them across requests.
+# Rates are kept for a day but refreshed in the background after an hour
+EXCHANGE_RATES_CACHE_KEY = 'fx_rates:v1'
+EXCHANGE_RATES_FRESH_KEY = 'fx_rates:fresh:v1'
+EXCHANGE_RATES_CACHE_TIMEOUT = 86400
+EXCHANGE_RATES_REFRESH_AFTER = 3600
+
+CUSTOMER_ANALYTICS_CACHE_TIMEOUT = 300
+
+# Rendered invoice HTML is keyed on the order's last update
+INVOICE_CACHE_TIMEOUT = 86400
+
+# Batch sizes for bulk writes and bulk email sends
+BULK_UPDATE_BATCH_SIZE = 5000
+BULK_EMAIL_BATCH_SIZE = 500
+
+# Prices are stored to two decimal places
+CENTS = Decimal('0.01')
+
 # =============================================================================
 # ORDER PROCESSING HELPER FUNCTIONS
 # =============================================================================
@@ -75,6 +104,17 @@ def send_order_notification(order, status):
         logger.error(f'Failed to send order notification: {e}')
         return False
 
+def send_order_custom_email(order, message):
+    """Send a free-form message to the customer about their order"""
+    send_mail(
+        subject=f'Update about your order {order.order_id}',
+        message=message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        recipient_list=[order.email or order.user.email],
+        fail_silently=False,
+    )
+    logger.info(f'Custom order email sent: {order.order_id}')
+
 def process_order_refund(order):
     """Process refund for cancelled order"""
     try:
@@ -102,22 +142,29 @@ def process_order_refund(order):
 def generate_invoice_pdf(order):
     """Generate professional HTML invoice for order"""
     try:
-        # Calculate tax percentage
-        if order.original_subtotal > 0:
-            tax_percentage = (order.tax_amount / order.original_subtotal) * 100
-        else:
-            tax_percentage = 0
+        # Rendered invoices are reused until the order or one of its items
+        # changes (see the Order / OrderItem signals)
+        cache_key = INVOICE_CACHE_KEY.format(order_id=order.id)
+        html_content = cache.get(cache_key)
         
-        context = {
-            'order': order,
-            'order_items': order.items.select_related('product').all(),
-            'company_name': 'CartMax',
-            'company_address': 'Your Store Address',
-            'tax_percentage': round(tax_percentage, 1),
-        }
-        
-        # Use professional HTML invoice template
-        html_content = render_to_string('store/professional_invoice.html', context)
+        if html_content is None:
+            # Calculate tax percentage
+            if order.original_subtotal > 0:
+                tax_percentage = (order.tax_amount / order.original_subtotal) * 100
+            else:
+                tax_percentage = 0
+            
+            context = {
+                'order': order,
+                'order_items': order.items.select_related('product').all(),
+                'company_name': 'CartMax',
+                'company_address': 'Your Store Address',
+                'tax_percentage': round(tax_percentage, 1),
+            }
+            
+            # Use professional HTML invoice template
+            html_content = render_to_string('store/professional_invoice.html', context)
+            cache.set(cache_key, html_content, INVOICE_CACHE_TIMEOUT)
         
         # Return as clean HTML that can be printed or saved as PDF via browser
         response = HttpResponse(html_content, content_type='text/html; charset=utf-8')
@@ -152,9 +199,14 @@ def get_customer_favorite_categories(user):
 def get_customer_lifetime_value(user):
     """Calculate customer lifetime value and metrics"""
     try:
-        orders = Order.objects.filter(user=user, status__in=['delivered', 'shipped'])
+        # One aggregate instead of exists() + sum + count + first()
+        stats = Order.objects.filter(user=user, status__in=['delivered', 'shipped']).aggregate(
+            total_spent=Sum('total'),
+            total_orders=Count('id'),
+            first_order=Min('created_at'),
+        )
         
-        if not orders.exists():
+        if not stats['total_orders']:
             return {
                 'total_spent': 0,
                 'avg_order_value': 0,
@@ -163,12 +215,12 @@ def get_customer_lifetime_value(user):
                 'customer_segment': 'New'
             }
         
-        total_spent = orders.aggregate(Sum('total'))['total__sum'] or 0
-        total_orders = orders.count()
+        total_spent = stats['total_spent'] or 0
+        total_orders = stats['total_orders']
         avg_order_value = total_spent / total_orders
         
         # Calculate order frequency (orders per month)
-        first_order = orders.order_by('created_at').first().created_at
+        first_order = stats['first_order']
         months_active = max(1, (timezone.now() - first_order).days / 30)
         order_frequency = total_orders / months_active
         
@@ -198,38 +250,67 @@ def get_customer_lifetime_value(user):
         logger.error(f'Failed to calculate CLV for user {user.id}: {e}')
         return {'error': str(e)}
 
+def refresh_exchange_rates():
+    """Fetch exchange rates and store them in the shared cache"""
+    rates = get_exchange_rates()
+    cache.set(EXCHANGE_RATES_CACHE_KEY, rates, EXCHANGE_RATES_CACHE_TIMEOUT)
+    cache.set(EXCHANGE_RATES_FRESH_KEY, True, EXCHANGE_RATES_REFRESH_AFTER)
+    return rates
+
+
+def get_cached_exchange_rates():
+    """
+    Get exchange rates from the cache. Only a cold cache waits on the fetch;
+    rates older than an hour are served as-is while one background task
+    refreshes them.
+    """
+    rates = cache.get(EXCHANGE_RATES_CACHE_KEY)
+    if rates is None:
+        return refresh_exchange_rates()
+    
+    # add() only succeeds once the fresh marker has expired, so a single
+    # request per refresh window queues the fetch
+    if cache.add(EXCHANGE_RATES_FRESH_KEY, True, EXCHANGE_RATES_REFRESH_AFTER):
+        run_in_background(refresh_exchange_rates)
+    return rates
+
+def build_customer_email(user, subject, message, template=None, connection=None):
+    """Build the professional-template email message for a customer"""
+    context = {
+        'customer_name': user.get_full_name() or user.username,
+        'message': message,
+        'site_name': 'CartMax',
+    }
+    
+    if template:
+        html_content = render_to_string(template, context)
+    else:
+        html_content = f"""
+        <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
+            <h2 style="color: #007bff;">Hello {context['customer_name']}!</h2>
+            <div style="padding: 20px; background: #f8f9fa; border-radius: 5px;">
+                {message}
+            </div>
+            <div style="margin-top: 20px; text-align: center; color: #666; font-size: 12px;">
+                Best regards,<br>CartMax Team
+            </div>
+        </div>
+        """
+    
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=message,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[user.email],
+        connection=connection,
+    )
+    email.attach_alternative(html_content, 'text/html')
+    return email
+
 def send_customer_email(user, subject, message, template=None):
     """Send email to customer with professional template"""
     try:
-        context = {
-            'customer_name': user.get_full_name() or user.username,
-            'message': message,
-            'site_name': 'CartMax',
-        }
-        
-        if template:
-            html_content = render_to_string(template, context)
-        else:
-            html_content = f"""
-            <div style="font-family: Arial, sans-serif; max-width: 600px; margin: 0 auto;">
-                <h2 style="color: #007bff;">Hello {context['customer_name']}!</h2>
-                <div style="padding: 20px; background: #f8f9fa; border-radius: 5px;">
-                    {message}
-                </div>
-                <div style="margin-top: 20px; text-align: center; color: #666; font-size: 12px;">
-                    Best regards,<br>CartMax Team
-                </div>
-            </div>
-            """
-        
-        send_mail(
-            subject=subject,
-            message=message,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            recipient_list=[user.email],
-            html_message=html_content,
-            fail_silently=False,
-        )
+        build_customer_email(user, subject, message, template).send(fail_silently=False)
         
         logger.info(f'Email sent to customer {user.id}: {subject}')
         return True
@@ -238,6 +319,31 @@ def send_customer_email(user, subject, message, template=None):
         logger.error(f'Failed to send email to customer {user.id}: {e}')
         return False
 
+def send_bulk_customer_email(customers, subject, message, template=None):
+    """Send the same email to many customers over a single mail connection.
+    Returns the number of messages sent."""
+    recipients = [customer for customer in customers if customer.email]
+    if not recipients:
+        return 0
+    
+    sent = 0
+    try:
+        # One connection per batch keeps memory bounded and lets earlier
+        # batches go out while later ones are still being built
+        for batch in chunked(recipients, BULK_EMAIL_BATCH_SIZE):
+            with get_connection(fail_silently=False) as connection:
+                sent += connection.send_messages([
+                    build_customer_email(customer, subject, message, template, connection=connection)
+                    for customer in batch
+                ]) or 0
+        
+        logger.info(f'Bulk email sent to {sent} customers: {subject}')
+        return sent
+        
+    except Exception as e:
+        logger.error(f'Failed to send bulk email after {sent} messages: {e}')
+        return sent
+
 
 @staff_member_required
 def admin_control_dashboard(request):
@@ -444,20 +550,12 @@ def product_performance_dashboard(request):
     
     # Review analysis
     highly_rated = Product.objects.filter(
-        available=True,
-        reviews__is_approved=True
-    ).annotate(
-        avg_rating=Avg('reviews__rating'),
-        review_count=Count('reviews')
-    ).filter(avg_rating__gte=4.5, review_count__gte=5).order_by('-avg_rating')[:10]
+        available=True, avg_rating__gte=4.5, review_count__gte=5
+    ).order_by('-avg_rating')[:10]
     
     poorly_rated = Product.objects.filter(
-        available=True,
-        reviews__is_approved=True
-    ).annotate(
-        avg_rating=Avg('reviews__rating'),
-        review_count=Count('reviews')
-    ).filter(avg_rating__lte=3.0, review_count__gte=3).order_by('avg_rating')[:10]
+        available=True, avg_rating__lte=3.0, review_count__gte=3
+    ).order_by('avg_rating')[:10]
     
     # Search performance
     popular_searches = SearchQuery.objects.filter(
@@ -545,9 +643,8 @@ def category_pricing_analysis(request, category_id):
     
     # Price distribution within category
     price_quartiles = []
-    if products.exists():
-        prices = list(products.values_list('price', flat=True))
-        prices.sort()
+    prices = sorted(products.values_list('price', flat=True))
+    if prices:
         n = len(prices)
         
         price_quartiles = {
@@ -579,7 +676,6 @@ def category_pricing_analysis(request, category_id):
     performance_data = products.annotate(
         units_sold=Sum('orderitem__quantity'),
         revenue=Sum(F('orderitem__quantity') * F('orderitem__price')),
-        avg_rating=Avg('reviews__rating')
     ).order_by('-revenue')
     
     context = {
@@ -733,10 +829,9 @@ def export_pricing_data(request):
     
     thirty_days_ago = timezone.now() - timedelta(days=30)
     
-    products = Product.objects.filter(available=True).annotate(
+    products = Product.objects.filter(available=True).with_pricing(currency).annotate(
         units_sold=Sum('orderitem__quantity'),
         revenue=Sum(F('orderitem__quantity') * F('orderitem__price')),
-        avg_rating=Avg('reviews__rating')
     )
     
     for product in products:
@@ -815,7 +910,7 @@ def product_list(request):
         'status': status,
         'category_id': int(category_id) if category_id else None,
         'order_by': order_by,
-        'total_count': products.count(),
+        'total_count': paginator.count,
     }
     
     return render(request, 'admin/products/product_list.html', context)
@@ -1008,7 +1103,7 @@ def order_list(request):
         'search': search,
         'status': status,
         'status_choices': Order._meta.get_field('status').choices,
-        'total_count': orders.count(),
+        'total_count': paginator.count,
     }
     
     return render(request, 'admin/orders/order_list.html', context)
@@ -1262,8 +1357,8 @@ def review_list(request):
         'reviews': page_obj,
         'search': search,
         'approval': approval,
-        'total_count': reviews.count(),
-        'pending_count': Review.objects.filter(is_approved=False).count(),
+        'total_count': paginator.count,
+        'pending_count': get_pending_review_count(),
     }
     
     return render(request, 'admin/reviews/review_list.html', context)
@@ -1353,7 +1448,7 @@ def user_list(request):
         'users': page_obj,
         'search': search,
         'user_type': user_type,
-        'total_count': users.count(),
+        'total_count': paginator.count,
     }
     
     return render(request, 'admin/users/user_list.html', context)
@@ -1388,18 +1483,19 @@ def user_detail(request, user_id):
     thirty_days_ago = timezone.now() - timedelta(days=30)
     recent_activity = {
         'orders_last_30_days': orders.filter(created_at__gte=thirty_days_ago).count(),
-        'last_order_date': orders.order_by('-created_at').first().created_at if orders.exists() else None,
+        'last_order_date': orders.aggregate(last=Max('created_at'))['last'],
         'favorite_categories': get_customer_favorite_categories(user),
         'payment_methods': orders.exclude(payment_method__isnull=True).values_list('payment_method', flat=True).distinct(),
     }
     
     # Customer reviews and engagement
     reviews = Review.objects.filter(user=user)
-    review_stats = {
-        'total_reviews': reviews.count(),
-        'approved_reviews': reviews.filter(is_approved=True).count(),
-        'avg_rating': reviews.aggregate(Avg('rating'))['rating__avg'] or 0,
-    }
+    review_stats = reviews.aggregate(
+        total_reviews=Count('id'),
+        approved_reviews=Count('id', filter=Q(is_approved=True)),
+        avg_rating=Avg('rating'),
+    )
+    review_stats['avg_rating'] = review_stats['avg_rating'] or 0
     
     # Customer lifetime value analysis
     clv_data = get_customer_lifetime_value(user)
@@ -1459,33 +1555,34 @@ def currency_conversion_view(request):
     """Currency conversion tool for admin"""
     form = CurrencyConversionForm()
     conversion_results = []
+    rates = get_cached_exchange_rates()
     
     if request.method == 'POST':
         form = CurrencyConversionForm(request.POST)
         if form.is_valid():
-            from_currency = form.cleaned_data['from_currency']
-            to_currency = form.cleaned_data['to_currency']
             apply_to_products = form.cleaned_data['apply_to_products']
             update_original = form.cleaned_data['update_original_prices']
             
-            rates = get_exchange_rates()
-            conversion_rate = form.get_conversion_rate()
-            
+            # Nothing to preview unless product prices are being converted
             if apply_to_products:
-                products = Product.objects.filter(available=True)
-                conversion_results = []
+                conversion_rate = form.get_conversion_rate(rates)
+                
+                # Preview only needs a few columns; skip model instantiation and
+                # apply the same multiplier to every priced row
+                products = Product.objects.filter(available=True, price__isnull=False).values_list(
+                    'id', 'name', 'price', 'original_price'
+                )
+                rate = Decimal(str(conversion_rate))
                 
-                for product in products:
-                    old_price = product.price
-                    new_price = convert_price(product.price, from_currency, to_currency, rates)
+                for product_id, name, old_price, old_original in products:
+                    new_price = (old_price * rate).quantize(CENTS)
                     
-                    old_original = product.original_price
                     new_original = None
                     if update_original and old_original:
-                        new_original = convert_price(old_original, from_currency, to_currency, rates)
+                        new_original = (old_original * rate).quantize(CENTS)
                     
                     conversion_results.append({
-                        'product': product,
+                        'product': {'id': product_id, 'name': name},
                         'old_price': old_price,
                         'new_price': new_price,
                         'old_original': old_original,
@@ -1493,19 +1590,13 @@ def currency_conversion_view(request):
                         'price_change': new_price - old_price,
                         'conversion_rate': conversion_rate
                     })
-                    
-                    # Apply conversion (uncomment when ready to implement)
-                    # product.price = new_price
-                    # if update_original and new_original:
-                    #     product.original_price = new_original
-                    # product.save()
                 
                 messages.success(request, f'Currency conversion preview completed. {len(conversion_results)} products would be affected.')
             
     context = {
         'form': form,
         'conversion_results': conversion_results,
-        'current_rates': get_exchange_rates(),
+        'current_rates': rates,
     }
     
     return render(request, 'admin/currency_conversion.html', context)
@@ -1521,72 +1612,85 @@ def bulk_product_operations_view(request):
     
     if request.method == 'POST':
         form = BulkProductOperationForm(request.POST)
-        selected_products = request.POST.getlist('selected_products')
+        try:
+            selected_products = [int(product_id) for product_id in request.POST.getlist('selected_products')]
+        except ValueError:
+            messages.error(request, 'Invalid product selection.')
+            return redirect('admin_dashboard:product_list')
         
         if form.is_valid() and selected_products:
             operation = form.cleaned_data['operation']
-            products = Product.objects.filter(id__in=selected_products)
+            products = Product.objects.filter(pk__in=selected_products)
             
-            if operation == 'activate':
-                updated = products.update(available=True)
-                messages.success(request, f'{updated} products activated successfully.')
+            # All writes for the operation commit together
+            with transaction.atomic():
+                if operation == 'activate':
+                    updated = products.update(available=True)
+                    messages.success(request, f'{updated} products activated successfully.')
                 
-            elif operation == 'deactivate':
-                updated = products.update(available=False)
-                messages.success(request, f'{updated} products deactivated successfully.')
+                elif operation == 'deactivate':
+                    updated = products.update(available=False)
+                    messages.success(request, f'{updated} products deactivated successfully.')
                 
-            elif operation == 'update_category':
-                new_category = form.cleaned_data['new_category']
-                if new_category:
-                    updated = products.update(category=new_category)
-                    messages.success(request, f'{updated} products moved to category "{new_category.name}".')
+                elif operation == 'update_category':
+                    new_category = form.cleaned_data['new_category']
+                    if new_category:
+                        updated = products.update(category=new_category)
+                        messages.success(request, f'{updated} products moved to category "{new_category.name}".')
                     
-            elif operation == 'apply_discount':
-                discount_percent = form.cleaned_data['discount_percentage']
-                if discount_percent:
-                    for product in products:
-                        if not product.original_price:
-                            product.original_price = product.price
-                        
-                        discount_multiplier = 1 - (discount_percent / 100)
-                        product.price = (product.original_price * discount_multiplier).quantize(Decimal('0.01'))
-                        product.save()
+                elif operation == 'apply_discount':
+                    discount_percent = form.cleaned_data['discount_percentage']
+                    if discount_percent:
+                        discount_multiplier = (Decimal('100') - discount_percent) / Decimal('100')
+                        product_list = list(products.only('id', 'price', 'original_price'))
+                        for product in product_list:
+                            if not product.original_price:
+                                product.original_price = product.price
+                            product.price = (product.original_price * discount_multiplier).quantize(CENTS)
+                    
+                        # One batched UPDATE instead of a save() per product
+                        Product.objects.bulk_update(product_list, ['price', 'original_price'], batch_size=BULK_UPDATE_BATCH_SIZE)
                         
-                    messages.success(request, f'{discount_percent}% discount applied to {products.count()} products.')
+                        messages.success(request, f'{discount_percent}% discount applied to {len(product_list)} products.')
                     
-            elif operation == 'update_stock':
-                stock_adjustment = form.cleaned_data['stock_adjustment']
-                if stock_adjustment is not None:
-                    for product in products:
-                        new_stock = max(0, product.stock + stock_adjustment)
-                        product.stock = new_stock
-                        product.save()
+                elif operation == 'update_stock':
+                    stock_adjustment = form.cleaned_data['stock_adjustment']
+                    if stock_adjustment is not None:
+                        # Let the database apply the adjustment, clamped at zero
+                        updated = products.update(stock=Greatest(F('stock') + stock_adjustment, 0))
                         
-                    action = 'increased' if stock_adjustment > 0 else 'decreased'
-                    messages.success(request, f'Stock {action} by {abs(stock_adjustment)} for {products.count()} products.')
+                        action = 'increased' if stock_adjustment > 0 else 'decreased'
+                        messages.success(request, f'Stock {action} by {abs(stock_adjustment)} for {updated} products.')
                     
-            elif operation == 'convert_currency':
-                target_currency = form.cleaned_data['target_currency']
-                if target_currency:
-                    rates = get_exchange_rates()
-                    base_currency = 'INR'  # Assuming INR is base
+                elif operation == 'convert_currency':
+                    target_currency = form.cleaned_data['target_currency']
+                    if target_currency:
+                        rates = get_cached_exchange_rates()
+                        base_currency = 'INR'  # Assuming INR is base
                     
-                    for product in products:
+                        updated = 0
                         if target_currency != base_currency:
-                            product.price = convert_price(product.price, base_currency, target_currency, rates)
-                            if product.original_price:
-                                product.original_price = convert_price(product.original_price, base_currency, target_currency, rates)
-                            product.save()
+                            # Conversion is a constant multiplier, so one UPDATE covers every row;
+                            # NULL original prices stay NULL through the arithmetic
+                            rate = Decimal(str(rates[f'{base_currency}_TO_{target_currency}']))
+                            updated = products.update(
+                                price=Round(F('price') * rate, 2),
+                                original_price=Round(F('original_price') * rate, 2),
+                            )
                             
-                    messages.success(request, f'Currency converted to {target_currency} for {products.count()} products.')
+                        messages.success(request, f'Currency converted to {target_currency} for {updated} products.')
             
             return redirect('admin_dashboard:product_list')
         else:
             if not selected_products:
                 messages.error(request, 'Please select products to perform bulk operations.')
     
-    # Get all products for selection
-    products = Product.objects.select_related('category').all()[:100]  # Limit for performance
+    # Get products for selection - only the fields the picker shows
+    products = list(
+        Product.objects.select_related('category').only(
+            'id', 'name', 'sku', 'category__name', 'price', 'available'
+        )[:100]  # Limit for performance
+    )
     
     context = {
         'form': form,
@@ -1604,14 +1708,16 @@ def bulk_product_operations_view(request):
 @staff_member_required
 def order_invoice(request, order_id):
     """Generate and display order invoice"""
-    order = get_object_or_404(Order, id=order_id)
+    order = get_object_or_404(Order.objects.select_related('user'), id=order_id)
     return generate_invoice_pdf(order)
 
 @staff_member_required  
 def order_packing_slip(request, order_id):
     """Generate packing slip for order"""
-    order = get_object_or_404(Order, id=order_id)
-    order_items = order.items.select_related('product').all()
+    order = get_object_or_404(Order.objects.select_related('user'), id=order_id)
+    order_items = order.items.select_related('product').only(
+        'quantity', 'price', 'product__name', 'product__brand', 'product__sku'
+    )
     
     context = {
         'order': order,
@@ -1625,31 +1731,25 @@ def order_packing_slip(request, order_id):
 @staff_member_required
 def send_order_email(request, order_id):
     """Send custom email to order customer"""
-    order = get_object_or_404(Order, id=order_id)
+    order = get_object_or_404(Order.objects.select_related('user'), id=order_id)
     
     if request.method == 'POST':
         email_type = request.POST.get('type', 'status_update')
         custom_message = request.POST.get('message', '')
         
         try:
-            # Send notification based on type
+            # Queue the email so the request doesn't wait on SMTP
             if email_type in ['confirmed', 'shipped', 'delivered', 'cancelled']:
-                success = send_order_notification(order, email_type)
+                run_in_background(send_order_notification_task, order.pk, email_type)
             else:
                 # Custom message
-                send_mail(
-                    subject=f'Update about your order {order.order_id}',
-                    message=custom_message,
-                    from_email=settings.DEFAULT_FROM_EMAIL,
-                    recipient_list=[order.email or order.user.email],
-                    fail_silently=False,
-                )
-                success = True
+                run_in_background(send_order_custom_email_task, order.pk, custom_message)
             
-            if success:
-                return JsonResponse({'success': True, 'message': 'Email sent successfully!'})
-            else:
-                return JsonResponse({'success': False, 'error': 'Failed to send email'})
+            return JsonResponse({
+                'success': True,
+                'queued': True,
+                'message': 'Email queued for best-effort background delivery. It is not retried on failure or restart; check the error log.',
+            })
                 
         except Exception as e:
             return JsonResponse({'success': False, 'error': str(e)})
@@ -1687,64 +1787,76 @@ def send_customer_email_view(request, user_id):
     
     return JsonResponse({'success': False, 'error': 'Invalid request method'})
 
+def build_customer_analytics():
+    """Compute customer counts, segments and monthly acquisition"""
+    # Get customer counts and segments in a single query: annotate each
+    # user's spend and recent order count, then count users conditionally
+    recent_cutoff = timezone.now() - timedelta(days=90)
+    customer_stats = User.objects.annotate(
+        total_spent=Sum('orders__total', filter=Q(orders__status__in=['delivered', 'shipped'])),
+        recent_orders=Count('orders', filter=Q(orders__created_at__gte=recent_cutoff)),
+    ).aggregate(
+        total_customers=Count('id', filter=Q(is_staff=False)),
+        active_customers=Count('id', filter=Q(is_staff=False, recent_orders__gt=0)),
+        VIP=Count('id', filter=Q(total_spent__gte=10000)),
+        Premium=Count('id', filter=Q(total_spent__gte=5000, total_spent__lt=10000)),
+        Regular=Count('id', filter=Q(total_spent__gte=1000, total_spent__lt=5000)),
+    )
+    
+    total_customers = customer_stats['total_customers']
+    active_customers = customer_stats['active_customers']
+    
+    # Customer segmentation
+    segments = {
+        'VIP': customer_stats['VIP'],
+        'Premium': customer_stats['Premium'],
+        'Regular': customer_stats['Regular'],
+    }
+    
+    # Monthly customer acquisition for the last 12 calendar months,
+    # grouped by month in the database instead of one COUNT per month
+    month_starts = [timezone.localtime().replace(day=1, hour=0, minute=0, second=0, microsecond=0)]
+    for _ in range(11):
+        month_starts.append((month_starts[-1] - timedelta(days=1)).replace(day=1))
+    month_starts.reverse()
+    
+    acquisition = User.objects.filter(
+        is_staff=False,
+        date_joined__gte=month_starts[0]
+    ).annotate(
+        month=TruncMonth('date_joined')
+    ).values('month').annotate(new_customers=Count('id')).order_by('month')
+    by_month = {(row['month'].year, row['month'].month): row['new_customers'] for row in acquisition}
+    
+    monthly_data = [
+        {
+            'month': month_start.strftime('%b %Y'),
+            'new_customers': by_month.get((month_start.year, month_start.month), 0)
+        }
+        for month_start in month_starts
+    ]
+    
+    return {
+        'total_customers': total_customers,
+        'active_customers': active_customers,
+        'segments': segments,
+        'monthly_acquisition': monthly_data
+    }
+
 @staff_member_required
 def customer_analytics_api(request):
     """API endpoint for customer analytics data"""
     try:
-        # Get customer segments
-        total_customers = User.objects.filter(is_staff=False).count()
-        active_customers = User.objects.filter(
-            is_staff=False,
-            orders__created_at__gte=timezone.now() - timedelta(days=90)
-        ).distinct().count()
-        
-        # Customer segmentation
-        segments = {
-            'VIP': User.objects.filter(
-                orders__status__in=['delivered', 'shipped']
-            ).annotate(
-                total_spent=Sum('orders__total')
-            ).filter(total_spent__gte=10000).count(),
-            
-            'Premium': User.objects.filter(
-                orders__status__in=['delivered', 'shipped']
-            ).annotate(
-                total_spent=Sum('orders__total')
-            ).filter(total_spent__gte=5000, total_spent__lt=10000).count(),
-            
-            'Regular': User.objects.filter(
-                orders__status__in=['delivered', 'shipped']
-            ).annotate(
-                total_spent=Sum('orders__total')
-            ).filter(total_spent__gte=1000, total_spent__lt=5000).count(),
-        }
-        
-        # Monthly customer acquisition
-        monthly_data = []
-        for i in range(12):
-            month_start = timezone.now().replace(day=1) - timedelta(days=30*i)
-            next_month = month_start + timedelta(days=32)
-            next_month = next_month.replace(day=1)
-            
-            new_customers = User.objects.filter(
-                is_staff=False,
-                date_joined__gte=month_start,
-                date_joined__lt=next_month
-            ).count()
-            
-            monthly_data.append({
-                'month': month_start.strftime('%b %Y'),
-                'new_customers': new_customers
-            })
+        # Dashboards poll this endpoint; the numbers change slowly
+        data = cache.get_or_set(
+            CUSTOMER_ANALYTICS_CACHE_KEY,
+            build_customer_analytics,
+            CUSTOMER_ANALYTICS_CACHE_TIMEOUT
+        )
         
         return JsonResponse({
             'success': True,
-            'data': {
-                'total_customers': total_customers,
-                'active_customers': active_customers,
-                'segments': segments,
-                'monthly_acquisition': list(reversed(monthly_data))
-            }
+            'data': data
         })
         
     except Exception as e:
@@ -1755,13 +1867,17 @@ def bulk_customer_operations(request):
     """Bulk operations on customers"""
     if request.method == 'POST':
         operation = request.POST.get('operation')
-        customer_ids = request.POST.getlist('customer_ids')
+        try:
+            customer_ids = [int(customer_id) for customer_id in request.POST.getlist('customer_ids')]
+        except ValueError:
+            messages.error(request, 'Invalid customer selection.')
+            return redirect('admin_dashboard:user_list')
         
         if not customer_ids:
             messages.error(request, 'Please select customers to perform operations on.')
             return redirect('admin_dashboard:user_list')
         
-        customers = User.objects.filter(id__in=customer_ids, is_staff=False)
+        customers = User.objects.filter(pk__in=customer_ids, is_staff=False)
         
         if operation == 'activate':
             updated = customers.update(is_active=True)
@@ -1776,12 +1892,15 @@ def bulk_customer_operations(request):
             message = request.POST.get('email_message', '')
             
             if subject and message:
-                success_count = 0
-                for customer in customers:
-                    if send_customer_email(customer, subject, message):
-                        success_count += 1
+                customer_ids = list(customers.exclude(email='').values_list('pk', flat=True))
+                run_in_background(send_bulk_customer_email_task, customer_ids, subject, message)
                 
-                messages.success(request, f'Email sent to {success_count} out of {customers.count()} customers.')
+                # Delivery happens after this response; only the queueing is known here
+                messages.info(
+                    request,
+                    f'Email queued for best-effort background delivery to {len(customer_ids)} customers. '
+                    f'It is not retried on failure or restart; check the error log.'
+                )
             else:
                 messages.error(request, 'Email subject and message are required.')
         
@@ -1794,61 +1913,70 @@ def bulk_customer_operations(request):
 # EXPORT FUNCTIONS
 # =============================================================================
 
+class Echo:
+    """File-like object that hands each written CSV line straight back"""
+    
+    def write(self, value):
+        return value
+
+
 @staff_member_required
 def export_pricing_data(request):
     """Export product pricing data as CSV"""
     import csv
-    from django.http import HttpResponse
-    
-    # Create the HttpResponse object with CSV header
-    response = HttpResponse(
-        content_type='text/csv',
-        headers={'Content-Disposition': 'attachment; filename="pricing_data.csv"'},
-    )
+    from django.http import StreamingHttpResponse
     
-    writer = csv.writer(response)
+    writer = csv.writer(Echo())
     
-    # Write CSV header
-    writer.writerow([
-        'Product ID',
-        'Product Name',
-        'SKU',
-        'Category',
-        'Current Price',
-        'Original Price',
-        'Discount %',
-        'Stock',
-        'Status',
-        'Created Date',
-        'Last Updated'
-    ])
-    
-    # Get all products with related data
-    products = Product.objects.select_related('category').all()
+    # Only the columns written to the file, streamed in chunks
+    products = Product.objects.select_related('category').only(
+        'id', 'name', 'sku', 'category__name', 'price', 'original_price',
+        'stock', 'available', 'created_at', 'updated_at'
+    )
     
-    for product in products:
-        # Calculate discount percentage
-        discount_percent = 0
-        if product.original_price and product.original_price > 0:
-            discount_percent = round(
-                ((product.original_price - product.price) / product.original_price) * 100, 2
-            )
-        
-        writer.writerow([
-            product.id,
-            product.name,
-            product.sku or 'N/A',
-            product.category.name if product.category else 'Uncategorized',
-            float(product.price),
-            float(product.original_price) if product.original_price else float(product.price),
-            discount_percent,
-            product.stock,
-            'Active' if product.available else 'Inactive',
-            product.created_at.strftime('%Y-%m-%d'),
-            product.updated_at.strftime('%Y-%m-%d')
+    def rows():
+        # Write CSV header
+        yield writer.writerow([
+            'Product ID',
+            'Product Name',
+            'SKU',
+            'Category',
+            'Current Price',
+            'Original Price',
+            'Discount %',
+            'Stock',
+            'Status',
+            'Created Date',
+            'Last Updated'
         ])
-    
-    return response
+        
+        for product in products.iterator(chunk_size=2000):
+            # Calculate discount percentage
+            discount_percent = 0
+            if product.original_price and product.original_price > 0:
+                discount_percent = round(
+                    ((product.original_price - product.price) / product.original_price) * 100, 2
+                )
+            
+            yield writer.writerow([
+                product.id,
+                product.name,
+                product.sku or 'N/A',
+                product.category.name if product.category else 'Uncategorized',
+                float(product.price),
+                float(product.original_price) if product.original_price else float(product.price),
+                discount_percent,
+                product.stock,
+                'Active' if product.available else 'Inactive',
+                product.created_at.strftime('%Y-%m-%d'),
+                product.updated_at.strftime('%Y-%m-%d')
+            ])
+    
+    return StreamingHttpResponse(
+        rows(),
+        content_type='text/csv',
+        headers={'Content-Disposition': 'attachment; filename="pricing_data.csv"'},
+    )
 
 
 # =============================================================================
@@ -1858,7 +1986,10 @@ def export_pricing_data(request):
 @staff_member_required
 def coupon_list(request):
     """List all discount coupons"""
-    coupons = DiscountCoupon.objects.all()
+    coupons = DiscountCoupon.objects.only(
+        'id', 'coupon_code', 'description', 'discount_type', 'discount_value',
+        'usage_count', 'max_usage_limit', 'is_active', 'expiration_date', 'created_at'
+    )
     
     # Filter by status
     status = request.GET.get('status')
@@ -1889,7 +2020,7 @@ def coupon_list(request):
         'coupons': page_obj,
         'search': search,
         'status': status,
-        'total_count': coupons.count(),
+        'total_count': paginator.count,
     }
     
     return render(request, 'admin/coupons/coupon_list.html', context)
@@ -1899,11 +2030,14 @@ def coupon_list(request):
 def coupon_detail(request, coupon_id):
     """View coupon details with usage statistics"""
     coupon = get_object_or_404(DiscountCoupon, id=coupon_id)
-    coupon_usages = CouponUsage.objects.filter(coupon=coupon).select_related('user')
+    coupon_usages = CouponUsage.objects.filter(coupon=coupon).select_related('user').only(
+        'usage_count', 'last_used_at', 'user__username', 'user__email'
+    )
     
     # Calculate usage statistics
     total_uses = coupon.usage_count
-    unique_users = coupon_usages.values('user').distinct().count()
+    # CouponUsage is unique per (coupon, user), so a plain COUNT is already distinct
+    unique_users = coupon_usages.count()
     remaining_uses = coupon.max_usage_limit - total_uses if coupon.max_usage_limit else 'Unlimited'
     
     context = {
@@ -1929,7 +2063,6 @@ def coupon_create(request):
         form = CouponForm(request.POST)
         if form.is_valid():
             coupon = form.save(commit=False)
-            coupon.coupon_code = coupon.coupon_code.upper().strip()
             coupon.created_by = request.user
             coupon.save()
             messages.success(
@@ -1963,7 +2096,6 @@ def coupon_edit(request, coupon_id):
         form = CouponForm(request.POST, instance=coupon)
         if form.is_valid():
             coupon = form.save(commit=False)
-            coupon.coupon_code = coupon.coupon_code.upper().strip()
             coupon.save()
             messages.success(
                 request,
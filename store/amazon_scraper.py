@@ -3,8 +3,14 @@ Real Amazon Price Scraper for CartMax
 IMPORTANT: Use responsibly and respect robots.txt and rate limits
 """
 
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import threading
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+from lxml import etree, html
 import re
 import time
 import random
@@ -14,13 +20,147 @@ from django.core.cache import cache
 
 logger = logging.getLogger(__name__)
 
+
+def _class_xpath(tag, class_name):
+    """XPath matching descendant `tag` elements that carry `class_name` as one of their classes"""
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
+# Compiled once at import; evaluated per page / per result container
+_XPATH_NAMESPACES = {'re': 'http://exslt.org/regular-expressions'}
+_SEARCH_RESULTS = etree.XPath("//div[@data-component-type='s-search-result']")
+_TITLE_HEADING = etree.XPath('.//h2')
+_TITLE_COLOR_SPAN = etree.XPath(".//span[re:test(@class, 's-.*-color')]", namespaces=_XPATH_NAMESPACES)
+_ANY_LINK = etree.XPath('.//a')
+_PRICE_WHOLE = etree.XPath(_class_xpath('span', 'a-price-whole'))
+_PRICE_FRACTION = etree.XPath(_class_xpath('span', 'a-price-fraction'))
+# Any class token starting with "a-price" (a-price, a-price-whole, ...)
+_PRICE_SPANS = etree.XPath(".//span[contains(concat(' ', normalize-space(@class)), ' a-price')]")
+_RATING = etree.XPath(_class_xpath('span', 'a-icon-alt'))
+_REVIEW_COUNT_LABEL = etree.XPath(".//*[contains(@aria-label, 'rating')]/@aria-label")
+_REVIEW_COUNT_LINK = etree.XPath(_class_xpath('span', 's-underline-text'))
+_REVIEW_CANDIDATES = etree.XPath('.//a | .//span')
+
+# Search pages are read only up to the results (see _read_search_page)
+MAX_SEARCH_PAGE_BYTES = 500_000
+SEARCH_PAGE_CHUNK_SIZE = 64 * 1024
+# The pagination widget element itself; the bare 's-pagination' class name
+# also shows up in inline CSS/JS ahead of the results
+SEARCH_PAGE_END_MARKER = b'cel_widget_id="MAIN-PAGINATION'
+
+# Scrape results live for SCRAPE_CACHE_TIMEOUT (jittered); once older than
+# SOFT_REFRESH_AFTER the cached data is still served while a background
+# thread re-scrapes it. Keys carry a :v2 suffix since entries became
+# {'data', 'refreshed_at'} envelopes - bare results cached by older code
+# under the unversioned keys are never read
+SCRAPE_CACHE_TIMEOUT = 14400
+SOFT_REFRESH_AFTER = 3600
+SOFT_REFRESH_LOCK_TIMEOUT = 300
+
+# Per-host token bucket updates are serialized with a short cache.add lock
+RATE_LIMIT_LOCK_TIMEOUT = 5
+RATE_LIMIT_LOCK_POLL = 0.05
+
+# Per-process copy of the hottest entries, checked before the shared cache
+LOCAL_CACHE_TIMEOUT = 60
+LOCAL_CACHE_MAX_ENTRIES = 512
+_LOCAL_CACHE = {}
+
+# Characters dropped from price text in a single str.translate pass
+_PRICE_NOISE = str.maketrans('', '', ',')
+_INR_PRICE_NOISE = str.maketrans('', '', ',₹')
+_USD_PRICE_NOISE = str.maketrans('', '', ',$')
+
+_RATING_NUMBER = re.compile(r'(\d+\.?\d*)')
+_GROUPED_INTEGER = re.compile(r'(\d+(?:,\d+)*)')
+
+
+def _query_key(query):
+    """Stable short hash of a search query for cache keys (unlike hash(), same in every process)"""
+    return hashlib.blake2b(query.lower().encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _jittered(timeout):
+    """Spread expiry by +/-1/12 of the timeout so keys written together don't expire together"""
+    spread = timeout // 12
+    return timeout + random.randint(-spread, spread)
+
+
+def _local_get(cache_key):
+    """Cache entry held by this process, or None if absent or older than LOCAL_CACHE_TIMEOUT"""
+    local = _LOCAL_CACHE.get(cache_key)
+    if local is None or time.time() - local[0] > LOCAL_CACHE_TIMEOUT:
+        return None
+    return local[1]
+
+
+def _local_set(cache_key, entry):
+    """Keep an entry in this process, evicting the oldest insert once the cache is full"""
+    _LOCAL_CACHE.pop(cache_key, None)
+    if len(_LOCAL_CACHE) >= LOCAL_CACHE_MAX_ENTRIES:
+        _LOCAL_CACHE.pop(next(iter(_LOCAL_CACHE)), None)
+    _LOCAL_CACHE[cache_key] = (time.time(), entry)
+
+
+def _cache_result(cache_key, data):
+    """Store scrape results with their refresh time and release any soft-refresh lock"""
+    entry = {'data': data, 'refreshed_at': time.time()}
+    cache.set(cache_key, entry, _jittered(SCRAPE_CACHE_TIMEOUT))
+    cache.delete(f'{cache_key}_refreshing')
+    _local_set(cache_key, entry)
+
+
+def _parse_rating(rating_text):
+    """Rating from text like "4.3 out of 5 stars"; the regex only runs for unusual layouts"""
+    try:
+        return float(rating_text.split(None, 1)[0])
+    except (IndexError, ValueError):
+        rating_match = _RATING_NUMBER.search(rating_text)
+        return float(rating_match.group(1)) if rating_match else None
+
+
+def _first(xpath, element):
+    """Return the first node matched by a compiled XPath, or None"""
+    matches = xpath(element)
+    return matches[0] if matches else None
+
+
+def _extract_reviews_count(container):
+    """Find the review count in a search result container"""
+    # Amazon exposes the count on a dedicated node; try those before
+    # falling back to scanning every link and span in the container
+    for label in _REVIEW_COUNT_LABEL(container):
+        match = _GROUPED_INTEGER.search(label)
+        if match:
+            return int(match.group(1).replace(',', ''))
+    
+    count_element = _first(_REVIEW_COUNT_LINK, container)
+    if count_element is not None:
+        match = _GROUPED_INTEGER.fullmatch(count_element.text_content().strip())
+        if match:
+            return int(match.group(1).replace(',', ''))
+    
+    for elem in _REVIEW_CANDIDATES(container):
+        text = elem.text_content()
+        lowered = text.lower()
+        if 'rating' in lowered or 'review' in lowered:
+            match = _GROUPED_INTEGER.search(text)
+            if match:
+                return int(match.group(1).replace(',', ''))
+    
+    return 0
+
+
 class AmazonPriceScraper:
     """
     Responsible Amazon price scraper with rate limiting and caching
     """
     
     def __init__(self):
-        self.session = requests.Session()
+        # requests.Session isn't thread-safe and this scraper is shared by
+        # request threads, search_both() workers and background refreshes,
+        # so each thread gets its own session (see the session property)
+        self._local = threading.local()
         
         # Rotate User-Agents to appear more natural
         self.user_agents = [
@@ -29,63 +169,175 @@ class AmazonPriceScraper:
             'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         ]
         
-        self.last_request_time = 0
-        self.min_delay = 2  # Minimum 2 seconds between requests
+        # One complete header set per User-Agent, built once; requests copies
+        # the dict when merging, so the shared dicts are never mutated.
+        # ACCEPT_ENCODING adds br / zstd only when brotli / zstandard are
+        # importable, so we never ask for a body urllib3 can't decode
+        self._headers_list = [
+            {
+                'User-Agent': user_agent,
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.5',
+                'Accept-Encoding': ACCEPT_ENCODING,
+                'Connection': 'keep-alive',
+                'Upgrade-Insecure-Requests': '1',
+            }
+            for user_agent in self.user_agents
+        ]
+        
+        # Token bucket per host: bursts of up to 3 requests, refilled at one
+        # request every 2 seconds. amazon.in and amazon.com don't wait on each other
+        self.bucket_capacity = 3
+        self.refill_rate = 0.5  # tokens per second
+    
+    @property
+    def session(self):
+        """This thread's requests.Session, created on first use"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._new_session()
+        return session
+    
+    @staticmethod
+    def _new_session():
+        session = requests.Session()
+        # Keep connections to amazon.in / amazon.com alive across scrapes and
+        # retry transient failures with backoff instead of giving up. A session
+        # serves one thread, so one pooled connection per host is enough
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=1,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=['GET'],
+                raise_on_status=False,
+            ),
+        )
+        session.mount('https://', adapter)
+        return session
     
     def _get_headers(self):
         """Get random headers for the request"""
-        return {
-            'User-Agent': random.choice(self.user_agents),
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        }
+        return random.choice(self._headers_list)
     
-    def _rate_limit(self):
-        """Implement rate limiting to be respectful"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
+    def _read_search_page(self, response):
+        """
+        Read a streamed search page only as far as the results.
+        Result containers sit at the top of the page; everything after the
+        pagination bar is recommendations and ads, so stop there (or at the
+        size cap) and let lxml recover the truncated markup.
+        """
+        chunks = []
+        total = 0
+        tail = b''
+        try:
+            for chunk in response.iter_content(SEARCH_PAGE_CHUNK_SIZE):
+                chunks.append(chunk)
+                total += len(chunk)
+                # Carry the previous chunk's tail so a marker split across
+                # two chunks is still found
+                window = tail + chunk
+                if total >= MAX_SEARCH_PAGE_BYTES or SEARCH_PAGE_END_MARKER in window:
+                    break
+                tail = window[-(len(SEARCH_PAGE_END_MARKER) - 1):]
+        finally:
+            response.close()
+        return b''.join(chunks)
+    
+    def _parse_html(self, content):
+        """Parse page HTML (Amazon serves UTF-8) into an lxml element tree"""
+        return html.fromstring(content, parser=html.HTMLParser(encoding='utf-8'))
+    
+    def _rate_limit(self, host):
+        """
+        Implement rate limiting to be respectful.
+        The bucket lives in the Django cache, so with a shared backend
+        (Redis/Memcached) every worker process draws from the same budget.
+        """
+        bucket_key = f'amazon_rate_limit_{host}'
+        lock_key = f'{bucket_key}_lock'
+        
+        # The read-modify-write below must not interleave across workers, or
+        # they all spend the same token; cache.add is atomic on every backend
+        deadline = time.time() + RATE_LIMIT_LOCK_TIMEOUT
+        while not cache.add(lock_key, True, RATE_LIMIT_LOCK_TIMEOUT):
+            if time.time() > deadline:
+                break  # holder died; its lock expires on its own
+            time.sleep(RATE_LIMIT_LOCK_POLL)
+        try:
+            now = time.time()
+            tokens, updated_at = cache.get(bucket_key, (self.bucket_capacity, now))
+            tokens = min(self.bucket_capacity, tokens + (now - updated_at) * self.refill_rate)
+            # Reserve our token now, even if that leaves the bucket in debt, so
+            # the lock is held only for the bookkeeping and not for the sleep
+            tokens -= 1
+            # An idle bucket is full again once the debt is repaid and it refills
+            refill_time = (self.bucket_capacity - tokens) / self.refill_rate
+            cache.set(bucket_key, (tokens, now), max(60, int(refill_time) + 1))
+        finally:
+            cache.delete(lock_key)
         
-        if time_since_last < self.min_delay:
-            sleep_time = self.min_delay - time_since_last + random.uniform(1, 3)
-            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+        if tokens < 0:
+            sleep_time = -tokens / self.refill_rate
+            logger.info(f"Rate limiting {host}: sleeping for {sleep_time:.2f} seconds")
             time.sleep(sleep_time)
+    
+    def _get_cached(self, cache_key, refresh, *args):
+        """
+        Return cached scrape data, or None on a miss. Stale entries are still
+        returned, with a single background `refresh(*args, force_refresh=True)`
+        started to replace them.
+        """
+        entry = _local_get(cache_key)
+        if entry and entry['data'] and time.time() - entry['refreshed_at'] <= SOFT_REFRESH_AFTER:
+            return entry['data']
         
-        self.last_request_time = time.time()
+        entry = cache.get(cache_key)
+        if not entry or not entry['data']:
+            return None
+        _local_set(cache_key, entry)
+        
+        if (time.time() - entry['refreshed_at'] > SOFT_REFRESH_AFTER
+                and cache.add(f'{cache_key}_refreshing', True, SOFT_REFRESH_LOCK_TIMEOUT)):
+            threading.Thread(
+                target=refresh, args=args, kwargs={'force_refresh': True}, daemon=True
+            ).start()
+        return entry['data']
     
-    def search_amazon_india(self, query, max_results=5):
+    def search_amazon_india(self, query, max_results=5, force_refresh=False):
         """
         Search Amazon India for products and extract prices
         """
-        cache_key = f'amazon_in_search_{hash(query.lower())}'
-        cached_result = cache.get(cache_key)
-        
-        if cached_result:
-            logger.info(f"Using cached Amazon India results for: {query}")
-            return cached_result
+        cache_key = f'amazon_in_search_{_query_key(query)}:v2'
+        if not force_refresh:
+            cached_result = self._get_cached(cache_key, self.search_amazon_india, query, max_results)
+            if cached_result:
+                logger.info(f"Using cached Amazon India results for: {query}")
+                return cached_result
         
         try:
-            self._rate_limit()
+            self._rate_limit('amazon.in')
             
             search_url = f"https://www.amazon.in/s?k={quote_plus(query)}&ref=nb_sb_noss"
             
             response = self.session.get(
                 search_url, 
                 headers=self._get_headers(),
-                timeout=10
+                timeout=10,
+                stream=True
             )
             
             if response.status_code != 200:
+                response.close()
                 logger.warning(f"Amazon India search failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            products = self._parse_amazon_india_results(soup, max_results)
+            tree = self._parse_html(self._read_search_page(response))
+            products = self._parse_amazon_india_results(tree, max_results)
             
-            # Cache for 4 hours
-            cache.set(cache_key, products, 14400)
+            _cache_result(cache_key, products)
             
             logger.info(f"Found {len(products)} products on Amazon India for '{query}'")
             return products
@@ -94,14 +346,12 @@ class AmazonPriceScraper:
             logger.error(f"Amazon India scraping failed: {e}")
             return []
     
-    def _parse_amazon_india_results(self, soup, max_results=5):
+    def _parse_amazon_india_results(self, tree, max_results=5):
         """Parse Amazon India search results"""
         products = []
         
         # Amazon India uses specific selectors for search results
-        product_containers = soup.find_all('div', {
-            'data-component-type': 's-search-result'
-        })[:max_results]
+        product_containers = _SEARCH_RESULTS(tree)[:max_results]
         
         for container in product_containers:
             try:
@@ -118,16 +368,16 @@ class AmazonPriceScraper:
         """Extract product data from Amazon India container"""
         try:
             # Product title - try multiple selectors
-            title_element = container.find('h2')
-            if not title_element:
-                title_element = container.find('span', class_=re.compile('s-.*-color'))
-            if not title_element:
-                title_element = container.find('a')
+            title_element = _first(_TITLE_HEADING, container)
+            if title_element is None:
+                title_element = _first(_TITLE_COLOR_SPAN, container)
+            if title_element is None:
+                title_element = _first(_ANY_LINK, container)
             
-            if not title_element:
+            if title_element is None:
                 return None
                 
-            title = title_element.get_text().strip()
+            title = title_element.text_content().strip()
             if len(title) < 3:
                 return None
             
@@ -135,12 +385,12 @@ class AmazonPriceScraper:
             price = None
             
             # Method 1: a-price-whole and a-price-fraction
-            price_container = container.find('span', class_='a-price-whole')
-            if price_container:
-                price_text = price_container.get_text().strip().replace(',', '').replace('₹', '').strip()
-                price_decimal = container.find('span', class_='a-price-fraction')
-                if price_decimal:
-                    price_text += '.' + price_decimal.get_text().strip()
+            price_container = _first(_PRICE_WHOLE, container)
+            if price_container is not None:
+                price_text = price_container.text_content().translate(_INR_PRICE_NOISE).strip()
+                price_decimal = _first(_PRICE_FRACTION, container)
+                if price_decimal is not None:
+                    price_text += '.' + price_decimal.text_content().strip()
                 try:
                     price = float(price_text)
                 except ValueError:
@@ -148,8 +398,8 @@ class AmazonPriceScraper:
             
             # Method 2: Look for price in any span
             if not price:
-                for span in container.find_all('span', class_=re.compile('a-price')):
-                    text = span.get_text().strip().replace(',', '').replace('₹', '').strip()
+                for span in _PRICE_SPANS(container):
+                    text = span.text_content().translate(_INR_PRICE_NOISE).strip()
                     if text and text[0].isdigit():
                         try:
                             price = float(text.split()[0])
@@ -161,23 +411,13 @@ class AmazonPriceScraper:
                 return None
             
             # Rating
-            rating_element = container.find('span', class_='a-icon-alt')
+            rating_element = _first(_RATING, container)
             rating = None
-            if rating_element:
-                rating_text = rating_element.get_text()
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                if rating_match:
-                    rating = float(rating_match.group(1))
+            if rating_element is not None:
+                rating = _parse_rating(rating_element.text_content())
             
             # Review count
-            reviews_count = 0
-            for elem in container.find_all(['a', 'span']):
-                text = elem.get_text()
-                if 'rating' in text.lower() or 'review' in text.lower():
-                    match = re.search(r'(\d+(?:,\d+)*)', text)
-                    if match:
-                        reviews_count = int(match.group(1).replace(',', ''))
-                        break
+            reviews_count = _extract_reviews_count(container)
             
             return {
                 'title': title,
@@ -193,35 +433,36 @@ class AmazonPriceScraper:
             logger.debug(f"Failed to extract Amazon India product: {e}")
             return None
     
-    def search_amazon_us(self, query, max_results=5):
+    def search_amazon_us(self, query, max_results=5, force_refresh=False):
         """Search Amazon US for products and extract prices"""
-        cache_key = f'amazon_us_search_{hash(query.lower())}'
-        cached_result = cache.get(cache_key)
-        
-        if cached_result:
-            logger.info(f"Using cached Amazon US results for: {query}")
-            return cached_result
+        cache_key = f'amazon_us_search_{_query_key(query)}:v2'
+        if not force_refresh:
+            cached_result = self._get_cached(cache_key, self.search_amazon_us, query, max_results)
+            if cached_result:
+                logger.info(f"Using cached Amazon US results for: {query}")
+                return cached_result
         
         try:
-            self._rate_limit()
+            self._rate_limit('amazon.com')
             
             search_url = f"https://www.amazon.com/s?k={quote_plus(query)}&ref=nb_sb_noss"
             
             response = self.session.get(
                 search_url, 
                 headers=self._get_headers(),
-                timeout=10
+                timeout=10,
+                stream=True
             )
             
             if response.status_code != 200:
+                response.close()
                 logger.warning(f"Amazon US search failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            products = self._parse_amazon_us_results(soup, max_results)
+            tree = self._parse_html(self._read_search_page(response))
+            products = self._parse_amazon_us_results(tree, max_results)
             
-            # Cache for 4 hours
-            cache.set(cache_key, products, 14400)
+            _cache_result(cache_key, products)
             
             logger.info(f"Found {len(products)} products on Amazon US for '{query}'")
             return products
@@ -230,13 +471,11 @@ class AmazonPriceScraper:
             logger.error(f"Amazon US scraping failed: {e}")
             return []
     
-    def _parse_amazon_us_results(self, soup, max_results=5):
+    def _parse_amazon_us_results(self, tree, max_results=5):
         """Parse Amazon US search results"""
         products = []
         
-        product_containers = soup.find_all('div', {
-            'data-component-type': 's-search-result'
-        })[:max_results]
+        product_containers = _SEARCH_RESULTS(tree)[:max_results]
         
         for container in product_containers:
             try:
@@ -253,16 +492,16 @@ class AmazonPriceScraper:
         """Extract product data from Amazon US container"""
         try:
             # Product title - try multiple selectors
-            title_element = container.find('h2')
-            if not title_element:
-                title_element = container.find('span', class_=re.compile('s-.*-color'))
-            if not title_element:
-                title_element = container.find('a')
+            title_element = _first(_TITLE_HEADING, container)
+            if title_element is None:
+                title_element = _first(_TITLE_COLOR_SPAN, container)
+            if title_element is None:
+                title_element = _first(_ANY_LINK, container)
             
-            if not title_element:
+            if title_element is None:
                 return None
                 
-            title = title_element.get_text().strip()
+            title = title_element.text_content().strip()
             if len(title) < 3:
                 return None
             
@@ -270,12 +509,12 @@ class AmazonPriceScraper:
             price = None
             
             # Method 1: a-price-whole and a-price-fraction
-            price_container = container.find('span', class_='a-price-whole')
-            if price_container:
-                price_text = price_container.get_text().strip().replace(',', '').replace('$', '').strip()
-                price_decimal = container.find('span', class_='a-price-fraction')
-                if price_decimal:
-                    price_text += '.' + price_decimal.get_text().strip()
+            price_container = _first(_PRICE_WHOLE, container)
+            if price_container is not None:
+                price_text = price_container.text_content().translate(_USD_PRICE_NOISE).strip()
+                price_decimal = _first(_PRICE_FRACTION, container)
+                if price_decimal is not None:
+                    price_text += '.' + price_decimal.text_content().strip()
                 try:
                     price = float(price_text)
                 except ValueError:
@@ -283,8 +522,8 @@ class AmazonPriceScraper:
             
             # Method 2: Look for price in any span
             if not price:
-                for span in container.find_all('span', class_=re.compile('a-price')):
-                    text = span.get_text().strip().replace(',', '').replace('$', '').strip()
+                for span in _PRICE_SPANS(container):
+                    text = span.text_content().translate(_USD_PRICE_NOISE).strip()
                     if text and text[0].isdigit():
                         try:
                             price = float(text.split()[0])
@@ -296,23 +535,13 @@ class AmazonPriceScraper:
                 return None
             
             # Rating
-            rating_element = container.find('span', class_='a-icon-alt')
+            rating_element = _first(_RATING, container)
             rating = None
-            if rating_element:
-                rating_text = rating_element.get_text()
-                rating_match = re.search(r'(\d+\.?\d*)', rating_text)
-                if rating_match:
-                    rating = float(rating_match.group(1))
+            if rating_element is not None:
+                rating = _parse_rating(rating_element.text_content())
             
             # Review count
-            reviews_count = 0
-            for elem in container.find_all(['a', 'span']):
-                text = elem.get_text()
-                if 'rating' in text.lower() or 'review' in text.lower():
-                    match = re.search(r'(\d+(?:,\d+)*)', text)
-                    if match:
-                        reviews_count = int(match.group(1).replace(',', ''))
-                        break
+            reviews_count = _extract_reviews_count(container)
             
             return {
                 'title': title,
@@ -328,24 +557,40 @@ class AmazonPriceScraper:
             logger.debug(f"Failed to extract Amazon US product: {e}")
             return None
     
-    def get_product_price_by_asin(self, asin, region='in'):
+    def search_both(self, query, max_results=5):
+        """
+        Search Amazon India and Amazon US in parallel.
+        Each region is a different host with its own rate limit, so the two
+        scrapes overlap instead of running back to back. Each worker thread
+        uses its own session.
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            india = executor.submit(self.search_amazon_india, query, max_results)
+            us = executor.submit(self.search_amazon_us, query, max_results)
+            return {
+                'india': india.result(),
+                'us': us.result(),
+            }
+    
+    def get_product_price_by_asin(self, asin, region='in', force_refresh=False):
         """
         Get specific product price by ASIN (Amazon Standard Identification Number)
         More accurate for known products
         """
         if region == 'in':
             url = f"https://www.amazon.in/dp/{asin}"
-            cache_key = f'amazon_in_asin_{asin}'
+            cache_key = f'amazon_in_asin_{asin}:v2'
         else:
             url = f"https://www.amazon.com/dp/{asin}"
-            cache_key = f'amazon_us_asin_{asin}'
+            cache_key = f'amazon_us_asin_{asin}:v2'
         
-        cached_result = cache.get(cache_key)
-        if cached_result:
-            return cached_result
+        if not force_refresh:
+            cached_result = self._get_cached(cache_key, self.get_product_price_by_asin, asin, region)
+            if cached_result:
+                return cached_result
         
         try:
-            self._rate_limit()
+            self._rate_limit('amazon.in' if region == 'in' else 'amazon.com')
             
             response = self.session.get(
                 url, 
@@ -356,21 +601,20 @@ class AmazonPriceScraper:
             if response.status_code != 200:
                 return None
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            tree = self._parse_html(response.content)
             
             # Extract price from product page
-            price_element = soup.find('span', class_='a-price-whole')
-            if not price_element:
+            price_element = _first(_PRICE_WHOLE, tree)
+            if price_element is None:
                 return None
             
-            price_text = price_element.get_text().strip().replace(',', '')
-            price_decimal = soup.find('span', class_='a-price-fraction')
-            if price_decimal:
-                price_text += '.' + price_decimal.get_text().strip()
+            price_text = price_element.text_content().translate(_PRICE_NOISE).strip()
+            price_decimal = _first(_PRICE_FRACTION, tree)
+            if price_decimal is not None:
+                price_text += '.' + price_decimal.text_content().strip()
             
             price = float(price_text)
             
-            # Cache for 2 hours (specific product prices change less frequently)
             result = {
                 'asin': asin,
                 'price': price,
@@ -379,7 +623,7 @@ class AmazonPriceScraper:
                 'timestamp': time.time()
             }
             
-            cache.set(cache_key, result, 7200)
+            _cache_result(cache_key, result)
             return result
             
         except Exception as e:
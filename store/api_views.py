@@ -4,6 +4,7 @@ Provides AJAX endpoints for applying/removing coupons from cart
 """
 
 from django.http import JsonResponse
+from django.db.models import prefetch_related_objects
 from django.views.decorators.http import require_http_methods, require_POST
 from django.views.decorators.csrf import csrf_exempt
 from django.contrib.auth.decorators import login_required
@@ -12,6 +13,7 @@ import json
 import logging
 
 from .models import Cart, DiscountCoupon
+from .utils import get_request_currency
 from .coupon_utils import (
     validate_coupon,
     apply_coupon_to_cart,
@@ -21,35 +23,46 @@ from .coupon_utils import (
 logger = logging.getLogger(__name__)
 
 
-def get_user_cart(request):
-    """Get or create cart for current user/session"""
+def get_user_cart(request, with_items=False):
+    """
+    Get or create cart for current user/session (once per request).
+    Pass with_items=True to also prefetch the cart items and their products
+    when the caller is going to compute totals.
+    """
+    if hasattr(request, '_cart'):
+        cart = request._cart
+        if with_items:
+            prefetch_related_objects([cart], 'items__product')
+        return cart
+    
+    carts = Cart.objects.select_related('applied_coupon')
+    if with_items:
+        carts = carts.prefetch_related('items__product')
+    
     if request.user.is_authenticated:
         # Try to get existing cart for user
-        cart = Cart.objects.filter(user=request.user).first()
+        cart = carts.filter(user=request.user).first()
         if not cart:
             # No cart for this user - create one
-            cart, created = Cart.objects.get_or_create(user=request.user)
+            cart, created = carts.get_or_create(user=request.user)
         
-        # Always set cart currency from user's preferred currency
-        if hasattr(request.user, 'profile') and request.user.profile.preferred_currency:
-            if cart.currency != request.user.profile.preferred_currency:
-                cart.currency = request.user.profile.preferred_currency
-                cart.save()
-        else:
-            # If no profile, default to USD
-            if cart.currency != 'USD':
-                cart.currency = 'USD'
-                cart.save()
+        # Always set cart currency from user's preferred currency (USD if no profile)
+        profile = getattr(request.user, 'profile', None)
+        user_currency = getattr(profile, 'preferred_currency', None) or 'USD'
+        if cart.currency != user_currency:
+            cart.currency = user_currency
+            cart.save(update_fields=['currency'])
     else:
         if not request.session.session_key:
             request.session.create()
-        cart, created = Cart.objects.get_or_create(session_key=request.session.session_key)
+        cart, created = carts.get_or_create(session_key=request.session.session_key)
         # For guests, try to get currency from session, otherwise default to USD
         currency = request.session.get('currency', 'USD')
         if cart.currency != currency:
             cart.currency = currency
-            cart.save()
+            cart.save(update_fields=['currency'])
     
+    request._cart = cart
     return cart
 
 
@@ -63,7 +76,6 @@ def apply_coupon_api(request):
     Response: {"success": true/false, "message": "...", "discount_amount": X, "discounted_total": Y}
     """
     try:
-        from .utils import get_user_currency
         data = json.loads(request.body)
         coupon_code = data.get('coupon_code', '').strip().upper()
         
@@ -78,9 +90,10 @@ def apply_coupon_api(request):
         
         # CRITICAL: Force cart currency to user's preferred currency
         if request.user.is_authenticated:
-            user_currency = get_user_currency(request.user)
-            cart.currency = user_currency
-            cart.save()
+            user_currency = get_request_currency(request)
+            if cart.currency != user_currency:
+                cart.currency = user_currency
+                cart.save(update_fields=['currency'])
         
         # Apply coupon
         result = apply_coupon_to_cart(coupon_code, cart, request.user)
@@ -132,13 +145,12 @@ def validate_coupon_api(request):
     Response: {"valid": true/false, "discount_amount": X, "message": "..."}
     """
     try:
-        from .utils import get_user_currency
         coupon_code = request.GET.get('code', '').strip().upper()
         amount_str = request.GET.get('amount', '0')
         
         # CRITICAL: Get user's actual currency from profile, not from request parameter
         if request.user.is_authenticated:
-            currency = get_user_currency(request.user).upper()
+            currency = get_request_currency(request).upper()
         else:
             currency = request.GET.get('currency', 'USD').upper()
         
@@ -205,14 +217,16 @@ def get_cart_summary_api(request):
     }
     """
     try:
-        cart = get_user_cart(request)
+        # Totals and item count all read the prefetched items
+        cart = get_user_cart(request, with_items=True)
         
-        subtotal = cart.get_total_price_in_currency(cart.currency)
-        discount_amount = cart.discount_amount or Decimal('0')
+        totals = cart.get_totals(cart.currency)
+        subtotal = totals['subtotal']
+        discount_amount = totals['discount']
         discounted_subtotal = subtotal - discount_amount
-        tax = cart.get_tax_in_currency(cart.currency)
+        tax = totals['tax']
         shipping = cart.shipping_amount if hasattr(cart, 'shipping_amount') else Decimal('0')
-        final_total = discounted_subtotal + tax + shipping
+        final_total = totals['final'] + shipping
         
         response = {
             'subtotal': float(subtotal),
@@ -2,10 +2,15 @@
 Utility functions for discount coupon operations
 """
 
+from django.db.models import DecimalField, F, Sum, prefetch_related_objects
 from django.utils import timezone
 from decimal import Decimal
+from functools import lru_cache
 from .models import DiscountCoupon, CouponUsage, Order
 from .utils import get_exchange_rate
+import logging
+
+logger = logging.getLogger(__name__)
 
 
 class CouponValidationError(Exception):
@@ -13,6 +18,36 @@ class CouponValidationError(Exception):
     pass
 
 
+ZERO = Decimal('0')
+CENTS = Decimal('0.01')
+TAX_RATE = Decimal('0.08')  # 8% tax, as in Cart.get_tax
+
+CURRENCY_SYMBOLS = {'INR': '₹', 'USD': '$'}
+
+# Columns validate_coupon and the apply/checkout paths read from a coupon;
+# updated_at is kept so usage_count saves still bump it
+COUPON_VALIDATION_FIELDS = (
+    'id', 'coupon_code', 'discount_type', 'discount_value', 'minimum_order_amount',
+    'maximum_order_amount', 'usage_count', 'max_usage_limit', 'is_active',
+    'expiration_date', 'amount_currency', 'updated_at',
+)
+
+
+@lru_cache(maxsize=32)
+def _rate_to_decimal(rate):
+    """Parse a float rate into a Decimal once per distinct rate value"""
+    return Decimal(str(rate))
+
+
+def _decimal_exchange_rate(from_currency, to_currency):
+    """
+    Current get_exchange_rate() as a Decimal. The rate is looked up on every
+    call so refreshed rates take effect at once; only the parse is cached,
+    keyed on the rate value itself.
+    """
+    return _rate_to_decimal(get_exchange_rate(from_currency, to_currency))
+
+
 def convert_coupon_amount_to_currency(amount, source_currency='USD', target_currency='USD'):
     """
     Convert coupon amount limits from source currency to target currency.
@@ -28,22 +63,27 @@ def convert_coupon_amount_to_currency(amount, source_currency='USD', target_curr
     Returns:
         Decimal: Converted amount in target currency
     """
-    # If source and target are the same, no conversion needed
-    if source_currency.upper() == target_currency.upper():
+    source_currency = source_currency.upper()
+    target_currency = target_currency.upper()
+    
+    # If source and target are the same (or there is nothing to convert), no conversion needed
+    if not amount or source_currency == target_currency:
         return amount
     
+    # Coupon amounts come from DecimalFields; only parse anything else
+    if not isinstance(amount, Decimal):
+        amount = Decimal(str(amount))
+    
     # Convert USD to INR
-    if source_currency.upper() == 'USD' and target_currency.upper() == 'INR':
-        rate = get_exchange_rate('USD', 'INR')
-        converted = Decimal(str(amount)) * Decimal(str(rate))
-        return converted.quantize(Decimal('0.01'))
+    if source_currency == 'USD' and target_currency == 'INR':
+        rate = _decimal_exchange_rate('USD', 'INR')
+        return (amount * rate).quantize(CENTS)
     
     # Convert INR to USD
-    elif source_currency.upper() == 'INR' and target_currency.upper() == 'USD':
-        rate = get_exchange_rate('USD', 'INR')
+    elif source_currency == 'INR' and target_currency == 'USD':
+        rate = _decimal_exchange_rate('USD', 'INR')
         if rate > 0:
-            converted = Decimal(str(amount)) / Decimal(str(rate))
-            return converted.quantize(Decimal('0.01'))
+            return (amount / rate).quantize(CENTS)
         return amount
     
     return amount
@@ -65,10 +105,13 @@ def validate_coupon(coupon_code, user, cart_total, currency='USD'):
             - error_message (str): Error message if invalid, "Valid" if valid
             - coupon_object (DiscountCoupon): The coupon object if found, None if not
     """
+    currency = currency.upper()
     
     # Check if coupon exists
     try:
-        coupon = DiscountCoupon.objects.get(coupon_code=coupon_code.upper().strip())
+        coupon = DiscountCoupon.objects.only(*COUPON_VALIDATION_FIELDS).get(
+            coupon_code=coupon_code.strip().upper()
+        )
     except DiscountCoupon.DoesNotExist:
         return False, "Invalid coupon code. Please check and try again.", None
     
@@ -84,39 +127,44 @@ def validate_coupon(coupon_code, user, cart_total, currency='USD'):
     if coupon.max_usage_limit and coupon.usage_count >= coupon.max_usage_limit:
         return False, "This coupon has reached its maximum usage limit.", coupon
     
-    # Check minimum order amount with proper currency conversion
-    if coupon.minimum_order_amount:
-        # Get the currency in which the coupon minimum amount is stored
-        coupon_amount_currency = getattr(coupon, 'amount_currency', 'USD')  # Default to USD if not set
+    # Amount limits are checked cheapest-first: coupons without any skip the currency work entirely
+    if coupon.minimum_order_amount or coupon.maximum_order_amount:
+        # Get the currency in which the coupon min/max amounts are stored (default USD);
+        # amounts are only converted when it differs from the cart's currency
+        coupon_amount_currency = (getattr(coupon, 'amount_currency', 'USD') or 'USD').upper()
+        needs_conversion = coupon_amount_currency != currency
         
-        # Convert coupon minimum amount to the cart's currency for comparison
-        converted_minimum = convert_coupon_amount_to_currency(
-            coupon.minimum_order_amount, 
-            coupon_amount_currency, 
-            currency
-        )
+        # Check minimum order amount with proper currency conversion
+        if coupon.minimum_order_amount:
+            converted_minimum = coupon.minimum_order_amount
+            if needs_conversion:
+                # Convert coupon minimum amount to the cart's currency for comparison
+                converted_minimum = convert_coupon_amount_to_currency(
+                    converted_minimum, 
+                    coupon_amount_currency, 
+                    currency
+                )
+            
+            if cart_total < converted_minimum:
+                # Use currency-appropriate symbol for display
+                currency_symbol = CURRENCY_SYMBOLS.get(currency, '$')
+                return False, f"This coupon requires a minimum order of {currency_symbol}{converted_minimum:.2f}. Your cart total is {currency_symbol}{cart_total:.2f}.", coupon
         
-        if cart_total < converted_minimum:
-            # Use currency-appropriate symbol for display
-            currency_symbol = '₹' if currency.upper() == 'INR' else '$'
-            return False, f"This coupon requires a minimum order of {currency_symbol}{converted_minimum}. Your cart total is {currency_symbol}{cart_total}.", coupon
-    
-    # Check maximum order amount with proper currency conversion
-    if coupon.maximum_order_amount:
-        # Get the currency in which the coupon maximum amount is stored
-        coupon_amount_currency = getattr(coupon, 'amount_currency', 'USD')  # Default to USD if not set
-        
-        # Convert coupon maximum amount to the cart's currency for comparison
-        converted_maximum = convert_coupon_amount_to_currency(
-            coupon.maximum_order_amount, 
-            coupon_amount_currency, 
-            currency
-        )
-        
-        if cart_total > converted_maximum:
-            # Use currency-appropriate symbol for display
-            currency_symbol = '₹' if currency.upper() == 'INR' else '$'
-            return False, f"This coupon is only valid for orders up to {currency_symbol}{converted_maximum}.", coupon
+        # Check maximum order amount with proper currency conversion
+        if coupon.maximum_order_amount:
+            converted_maximum = coupon.maximum_order_amount
+            if needs_conversion:
+                # Convert coupon maximum amount to the cart's currency for comparison
+                converted_maximum = convert_coupon_amount_to_currency(
+                    converted_maximum, 
+                    coupon_amount_currency, 
+                    currency
+                )
+            
+            if cart_total > converted_maximum:
+                # Use currency-appropriate symbol for display
+                currency_symbol = CURRENCY_SYMBOLS.get(currency, '$')
+                return False, f"This coupon is only valid for orders up to {currency_symbol}{converted_maximum:.2f}.", coupon
     
     # Per-user usage limits are disabled - coupons can be used multiple times
     # This allows users to apply the same coupon to multiple orders
@@ -137,7 +185,7 @@ def calculate_discount(coupon, subtotal):
         Decimal: The discount amount
     """
     if not coupon:
-        return Decimal('0')
+        return ZERO
     
     return coupon.calculate_discount(subtotal)
 
@@ -163,11 +211,11 @@ def apply_coupon_to_cart(coupon_code, cart, user):
             }
     """
     from django.contrib.auth.models import AnonymousUser
-    import sys
     
-    # Refresh cart to ensure latest currency setting
-    from .models import Cart as CartModel
-    cart = CartModel.objects.get(pk=cart.pk)
+    # Refresh the fields that may have drifted since the cart was loaded. Items
+    # and their products are loaded once here and reused by every total below
+    cart.refresh_from_db(fields=['currency', 'applied_coupon'])
+    prefetch_related_objects([cart], 'items__product')
     
     # Ensure cart currency is set correctly from user profile if authenticated
     if user and not isinstance(user, AnonymousUser):
@@ -177,13 +225,13 @@ def apply_coupon_to_cart(coupon_code, cart, user):
                 cart.save()
     
     # Get cart subtotal - always calculate directly from items
-    cart_subtotal = Decimal('0')
+    cart_subtotal = ZERO
     items_list = list(cart.items.all())
     for item in items_list:
         item_total = item.get_total_price_in_currency(cart.currency)
         cart_subtotal += item_total
     
-    print(f'DEBUG: Cart {cart.id}, currency={cart.currency}, items={len(items_list)}, subtotal={cart_subtotal}', file=sys.stderr)
+    logger.debug('Cart %s, currency=%s, items=%d, subtotal=%s', cart.id, cart.currency, len(items_list), cart_subtotal)
     
     # If still 0, cannot apply coupon
     if cart_subtotal <= 0:
@@ -205,21 +253,22 @@ def apply_coupon_to_cart(coupon_code, cart, user):
     cart.applied_coupon = coupon
     cart.calculate_discount()
     cart.save()
+    totals = cart.get_totals(cart.currency)
     
     return {
         'success': True,
         'message': f"Coupon applied! You saved {cart.discount_amount} {cart.currency}.",
         'coupon_code': coupon.coupon_code,
         'discount_amount': float(cart.discount_amount),
-        'discounted_total': float(cart.get_discounted_total()),
+        'discounted_total': float(totals['subtotal'] - totals['discount']),
         'currency': cart.currency,
         'currency_symbol': cart.get_currency_symbol(),
         'subtotal': float(cart_subtotal),
         'original_subtotal': float(cart_subtotal),
-        'tax': float(cart.get_tax_in_currency(cart.currency)),
+        'tax': float(totals['tax']),
         'shipping': 0.0,
         'applied_coupon': coupon.coupon_code,
-        'final_total': float(cart.get_final_total_in_currency(cart.currency))
+        'final_total': float(totals['subtotal'] + totals['tax'])
     }
 
 
@@ -234,7 +283,7 @@ def remove_coupon_from_cart(cart):
         dict: Response with success status
     """
     cart.applied_coupon = None
-    cart.discount_amount = Decimal('0')
+    cart.discount_amount = ZERO
     cart.save()
     
     return {
@@ -263,8 +312,16 @@ def apply_coupon_to_order(coupon_code, order, user):
     """
     from django.db import transaction
     
-    # Get order subtotal
-    order_subtotal = sum(item.get_total_price_in_currency(order.currency) for item in order.items.all())
+    # Get order subtotal from the items' price snapshots in one aggregate
+    # (same as summing OrderItem.get_total_price_in_currency; NULL prices count as 0)
+    price_field = 'price_inr' if order.currency.upper() == 'INR' else 'price_usd'
+    order_subtotal = order.items.aggregate(
+        subtotal=Sum(
+            F('quantity') * F(price_field),
+            output_field=DecimalField(max_digits=12, decimal_places=2),
+        )
+    )['subtotal']
+    order_subtotal = order_subtotal.quantize(CENTS) if order_subtotal is not None else ZERO
     
     # Validate coupon
     is_valid, error_message, coupon = validate_coupon(coupon_code, user, order_subtotal, order.currency)
@@ -296,7 +353,7 @@ def apply_coupon_to_order(coupon_code, order, user):
         
         # Recalculate tax on discounted amount
         discounted_subtotal = order_subtotal - discount
-        order.tax_amount = discounted_subtotal * Decimal('0.08')
+        order.tax_amount = discounted_subtotal * TAX_RATE
         
         # Save order with discount
         order.save()
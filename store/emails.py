@@ -1,4 +1,4 @@
-from django.core.mail import EmailMultiAlternatives
+from django.core.mail import EmailMultiAlternatives, get_connection
 from django.template.loader import render_to_string
 from django.conf import settings
 from django.utils.html import strip_tags
@@ -86,9 +86,10 @@ The CartMax Team
         logger.error(f"Failed to send order status update email for order #{order.order_number}: {str(e)}")
         return False
 
-def send_low_stock_alert_email(product):
+def send_low_stock_alert_email(product, connection=None):
     """
     Send low stock alert to admin
+    Pass an open mail connection to reuse it across several alerts.
     """
     try:
         subject = f'Low Stock Alert: {product.name} - CartMax'
@@ -113,6 +114,7 @@ CartMax Admin System
                 body=message.strip(),
                 from_email=settings.DEFAULT_FROM_EMAIL,
                 to=admin_emails,
+                connection=connection,
             )
             
             email.send()
@@ -122,4 +124,16 @@ CartMax Admin System
         
     except Exception as e:
         logger.error(f"Failed to send low stock alert email for product {product.name}: {str(e)}")
-        return False
\ No newline at end of file
+        return False
+
+
+def send_low_stock_alert_emails(products):
+    """
+    Send low stock alerts for several products over one mail connection
+    Returns the number of alerts sent.
+    """
+    with get_connection() as connection:
+        return sum(
+            1 for product in products
+            if send_low_stock_alert_email(product, connection=connection)
+        )
@@ -0,0 +1,809 @@
+# Generated by Django 4.2.17 on 2026-10-16 14:47
+
+from decimal import Decimal
+from django.conf import settings
+import django.contrib.postgres.search
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AdminRole',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(choices=[('supreme_admin', '👑 Supreme Admin - Controls Everything'), ('product_manager', '📦 Product Manager - Catalog Control'), ('order_manager', '📋 Order Manager - Fulfillment Control'), ('customer_service', '👥 Customer Service - User Support'), ('analyst', '📊 Analyst - Reports & Analytics'), ('moderator', '🛡️ Moderator - Content Control')], max_length=50, unique=True)),
+                ('display_name', models.CharField(max_length=100)),
+                ('description', models.TextField()),
+                ('permissions', models.JSONField(default=dict, help_text='Custom permissions JSON')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Admin Role',
+                'verbose_name_plural': 'Admin Roles',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Cart',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('currency', models.CharField(choices=[('INR', 'Indian Rupee (₹)'), ('USD', 'US Dollar ($)')], default='USD', max_length=3)),
+                ('discount_amount', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Category',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100, unique=True)),
+                ('slug', models.SlugField(blank=True, max_length=100, unique=True)),
+                ('description', models.TextField(blank=True)),
+                ('image', models.ImageField(blank=True, null=True, upload_to='categories/')),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'Categories',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='DiscountCoupon',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('coupon_code', models.CharField(db_index=True, help_text='Unique code users will enter (e.g., SAVE10)', max_length=50, unique=True)),
+                ('description', models.TextField(blank=True, help_text='Internal description of this coupon')),
+                ('discount_type', models.CharField(choices=[('percentage', 'Percentage (%)'), ('fixed_amount', 'Fixed Amount')], default='percentage', help_text='Type of discount: percentage or fixed amount', max_length=20)),
+                ('discount_value', models.DecimalField(decimal_places=2, help_text='Discount value (percentage 0-100 or fixed amount)', max_digits=10, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('minimum_order_amount', models.DecimalField(blank=True, decimal_places=2, help_text='Minimum order amount required to use this coupon', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('maximum_order_amount', models.DecimalField(blank=True, decimal_places=2, help_text='Maximum order amount this coupon is valid for (null = no limit)', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('usage_count', models.PositiveIntegerField(default=0, help_text='Total number of times this coupon has been used')),
+                ('max_usage_limit', models.PositiveIntegerField(blank=True, help_text='Maximum total uses allowed (null = unlimited)', null=True)),
+                ('is_active', models.BooleanField(default=True, help_text='Enable/disable this coupon')),
+                ('expiration_date', models.DateTimeField(blank=True, help_text='When this coupon expires (null = no expiration)', null=True)),
+                ('applicable_currencies', models.CharField(choices=[('USD', 'US Dollar ($)'), ('INR', 'Indian Rupee (₹)'), ('both', 'Both USD & INR')], default='both', help_text='Which currencies this coupon is valid for', max_length=20)),
+                ('amount_currency', models.CharField(choices=[('USD', 'US Dollar ($)'), ('INR', 'Indian Rupee (₹)')], default='USD', help_text='Currency in which minimum and maximum order amounts are specified', max_length=20)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('created_by', models.ForeignKey(help_text='Admin user who created this coupon', on_delete=django.db.models.deletion.CASCADE, related_name='created_coupons', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Discount Coupon',
+                'verbose_name_plural': 'Discount Coupons',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='InventorySettings',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('low_stock_threshold', models.PositiveIntegerField(default=10, help_text='Default low stock threshold')),
+                ('critical_stock_threshold', models.PositiveIntegerField(default=5, help_text='Default critical stock threshold')),
+                ('auto_create_alerts', models.BooleanField(default=True, help_text='Automatically create stock alerts')),
+                ('email_alerts', models.BooleanField(default=True, help_text='Send email alerts for low stock')),
+                ('alert_frequency_hours', models.PositiveIntegerField(default=24, help_text='Hours between repeated alerts')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Inventory Settings',
+                'verbose_name_plural': 'Inventory Settings',
+            },
+        ),
+        migrations.CreateModel(
+            name='Order',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('order_id', models.CharField(blank=True, max_length=20, unique=True)),
+                ('first_name', models.CharField(blank=True, max_length=100)),
+                ('last_name', models.CharField(blank=True, max_length=100)),
+                ('email', models.EmailField(blank=True, max_length=254)),
+                ('phone', models.CharField(blank=True, max_length=20)),
+                ('address', models.CharField(blank=True, max_length=200)),
+                ('city', models.CharField(blank=True, max_length=100)),
+                ('postal_code', models.CharField(blank=True, max_length=20)),
+                ('country', models.CharField(blank=True, default='US', max_length=100)),
+                ('total', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('tax_amount', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('shipping_amount', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('status', models.CharField(choices=[('pending', 'Pending'), ('processing', 'Processing'), ('shipped', 'Shipped'), ('delivered', 'Delivered'), ('cancelled', 'Cancelled')], default='pending', max_length=20)),
+                ('payment_method', models.CharField(choices=[('credit_card', 'Credit Card'), ('paypal', 'PayPal'), ('cartmax_pay', 'CartMax Wallet')], default='credit_card', max_length=20)),
+                ('currency', models.CharField(choices=[('INR', 'Indian Rupee (₹)'), ('USD', 'US Dollar ($)')], default='USD', max_length=3)),
+                ('discount_amount', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('original_subtotal', models.DecimalField(decimal_places=2, default=0, max_digits=10)),
+                ('shipping_name', models.CharField(blank=True, max_length=200)),
+                ('shipping_address_line_1', models.CharField(blank=True, max_length=200)),
+                ('shipping_address_line_2', models.CharField(blank=True, max_length=200)),
+                ('shipping_city', models.CharField(blank=True, max_length=100)),
+                ('shipping_state', models.CharField(blank=True, max_length=100)),
+                ('shipping_postal_code', models.CharField(blank=True, max_length=20)),
+                ('shipping_country', models.CharField(blank=True, max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('applied_coupon', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='orders', to='store.discountcoupon')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='orders', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='PopularSearch',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(db_index=True, max_length=255, unique=True)),
+                ('search_count', models.PositiveIntegerField(default=0)),
+                ('last_searched', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Popular Search',
+                'verbose_name_plural': 'Popular Searches',
+                'ordering': ['-search_count', '-last_searched'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=200)),
+                ('slug', models.SlugField(blank=True, max_length=200, unique=True)),
+                ('description', models.TextField()),
+                ('short_description', models.CharField(blank=True, max_length=300)),
+                ('price_inr', models.DecimalField(blank=True, decimal_places=2, help_text='Price in INR', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('price_usd', models.DecimalField(blank=True, decimal_places=2, help_text='Price in USD', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('original_price_inr', models.DecimalField(blank=True, decimal_places=2, help_text='Original price in INR (for discount calculation)', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('original_price_usd', models.DecimalField(blank=True, decimal_places=2, help_text='Original price in USD (for discount calculation)', max_digits=10, null=True, validators=[django.core.validators.MinValueValidator(Decimal('0.01'))])),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('original_price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('brand', models.CharField(blank=True, max_length=100)),
+                ('sku', models.CharField(blank=True, max_length=50, unique=True)),
+                ('stock', models.PositiveIntegerField(default=0)),
+                ('available', models.BooleanField(default=True)),
+                ('featured', models.BooleanField(default=False)),
+                ('main_image', models.ImageField(blank=True, null=True, upload_to='products/')),
+                ('avg_rating', models.DecimalField(decimal_places=2, default=0, max_digits=3)),
+                ('review_count', models.PositiveIntegerField(default=0)),
+                ('search_keywords', models.TextField(blank=True, help_text='Additional keywords for search (comma-separated)')),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(editable=False, null=True)),
+                ('meta_title', models.CharField(blank=True, help_text='SEO title for search engines', max_length=200)),
+                ('meta_description', models.TextField(blank=True, help_text='SEO description for search engines')),
+                ('weight', models.DecimalField(blank=True, decimal_places=2, help_text='Weight in kg', max_digits=8, null=True)),
+                ('dimensions', models.CharField(blank=True, help_text='Dimensions (L x W x H)', max_length=100)),
+                ('color', models.CharField(blank=True, max_length=50)),
+                ('size', models.CharField(blank=True, max_length=50)),
+                ('material', models.CharField(blank=True, max_length=100)),
+                ('min_order_quantity', models.PositiveIntegerField(default=1)),
+                ('is_digital', models.BooleanField(default=False, help_text='Is this a digital product?')),
+                ('is_returnable', models.BooleanField(default=True)),
+                ('warranty_period', models.CharField(blank=True, help_text="e.g., '1 year', '6 months'", max_length=100)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('category', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='products', to='store.category')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductTag',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=50, unique=True)),
+                ('slug', models.SlugField(blank=True, unique=True)),
+                ('color', models.CharField(default='#007bff', help_text='Hex color code for tag display', max_length=7)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Product Tag',
+                'verbose_name_plural': 'Product Tags',
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchProductClick',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('click_position', models.PositiveIntegerField(help_text='Position in search results (1-based)')),
+                ('clicked_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_clicks', to='store.product')),
+            ],
+            options={
+                'verbose_name': 'Search Product Click',
+                'verbose_name_plural': 'Search Product Clicks',
+                'ordering': ['click_position'],
+            },
+        ),
+        migrations.CreateModel(
+            name='Wishlist',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_key', models.CharField(blank=True, help_text='Session key for guest users', max_length=40, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='wishlists', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('phone', models.CharField(blank=True, max_length=20)),
+                ('address_line_1', models.CharField(blank=True, max_length=200)),
+                ('address_line_2', models.CharField(blank=True, max_length=200)),
+                ('address', models.CharField(blank=True, max_length=200)),
+                ('city', models.CharField(blank=True, max_length=100)),
+                ('state', models.CharField(blank=True, max_length=100)),
+                ('postal_code', models.CharField(blank=True, max_length=20)),
+                ('country', models.CharField(default='United States', max_length=100)),
+                ('date_of_birth', models.DateField(blank=True, null=True)),
+                ('preferred_currency', models.CharField(choices=[('INR', 'Indian Rupee (₹)'), ('USD', 'US Dollar ($)')], default='USD', max_length=3)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='profile', to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='UserProductInteraction',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('interaction_type', models.CharField(choices=[('view', 'Product View'), ('cart', 'Added to Cart'), ('purchase', 'Purchase'), ('wishlist', 'Added to Wishlist'), ('review', 'Left a Review')], max_length=20)),
+                ('interaction_count', models.PositiveIntegerField(default=1)),
+                ('last_interaction', models.DateTimeField(auto_now=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_interactions', to='store.product')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_interactions', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-last_interaction'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SiteConfiguration',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(help_text='Configuration key', max_length=100, unique=True)),
+                ('value', models.TextField(help_text='Configuration value (JSON for complex data)')),
+                ('description', models.CharField(help_text='Human-readable description', max_length=200)),
+                ('category', models.CharField(default='general', help_text='Configuration category', max_length=50)),
+                ('is_secret', models.BooleanField(default=False, help_text='Hide value in admin (passwords, keys)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('updated_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Site Configuration',
+                'verbose_name_plural': 'Site Configurations',
+                'ordering': ['category', 'key'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SiteAnnouncement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('announcement_type', models.CharField(choices=[('info', 'Information'), ('warning', 'Warning'), ('success', 'Success'), ('danger', 'Critical Alert'), ('promotion', 'Promotion'), ('maintenance', 'Maintenance')], default='info', max_length=20)),
+                ('priority', models.CharField(choices=[('low', 'Low Priority'), ('medium', 'Medium Priority'), ('high', 'High Priority'), ('urgent', 'Urgent')], default='medium', max_length=20)),
+                ('target_audience', models.CharField(choices=[('all', 'All Users'), ('registered', 'Registered Users Only'), ('guests', 'Guest Users Only'), ('staff', 'Staff Only'), ('premium', 'Premium Users')], default='all', max_length=20)),
+                ('start_date', models.DateTimeField()),
+                ('end_date', models.DateTimeField(blank=True, null=True)),
+                ('is_active', models.BooleanField(default=True)),
+                ('is_dismissible', models.BooleanField(default=True)),
+                ('show_on_homepage', models.BooleanField(default=True)),
+                ('show_in_header', models.BooleanField(default=False)),
+                ('show_as_popup', models.BooleanField(default=False)),
+                ('action_button_text', models.CharField(blank=True, max_length=50, null=True)),
+                ('action_button_url', models.URLField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('views_count', models.PositiveIntegerField(default=0)),
+                ('clicks_count', models.PositiveIntegerField(default=0)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='created_announcements', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Site Announcement',
+                'verbose_name_plural': 'Site Announcements',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SearchQuery',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('query', models.CharField(db_index=True, max_length=255)),
+                ('session_key', models.CharField(blank=True, max_length=255, null=True)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('category_filter', models.CharField(blank=True, max_length=100)),
+                ('price_filter', models.CharField(blank=True, max_length=50)),
+                ('brand_filter', models.CharField(blank=True, max_length=100)),
+                ('sort_by', models.CharField(blank=True, max_length=50)),
+                ('results_count', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('clicked_products', models.ManyToManyField(blank=True, through='store.SearchProductClick', to='store.product')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Search Query',
+                'verbose_name_plural': 'Search Queries',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='searchproductclick',
+            name='search_query',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_clicks', to='store.searchquery'),
+        ),
+        migrations.CreateModel(
+            name='Review',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('rating', models.IntegerField(choices=[(1, '1 Star'), (2, '2 Stars'), (3, '3 Stars'), (4, '4 Stars'), (5, '5 Stars')], validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(5)])),
+                ('title', models.CharField(max_length=200)),
+                ('comment', models.TextField()),
+                ('is_approved', models.BooleanField(default=True)),
+                ('helpful_votes', models.PositiveIntegerField(default=0)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='reviews', to='store.product')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductTagAssignment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tag_assignments', to='store.product')),
+                ('tag', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='product_assignments', to='store.producttag')),
+            ],
+            options={
+                'verbose_name': 'Product Tag Assignment',
+                'verbose_name_plural': 'Product Tag Assignments',
+                'ordering': ['tag__name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSpecification',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=100)),
+                ('value', models.CharField(max_length=200)),
+                ('order', models.PositiveIntegerField(default=0)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='specifications', to='store.product')),
+            ],
+            options={
+                'ordering': ['order', 'name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductSlug',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('slug', models.SlugField(max_length=200, unique=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='old_slugs', to='store.product')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductRecommendation',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('recommendation_type', models.CharField(choices=[('similar', 'Similar Products'), ('frequently_bought', 'Frequently Bought Together'), ('popular', 'Popular Products'), ('user_based', 'Recommended for You'), ('trending', 'Trending Now')], max_length=20)),
+                ('score', models.FloatField(default=0.0, help_text='Recommendation strength (0.0-1.0)')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommendations', to='store.product')),
+                ('recommended_product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recommended_for', to='store.product')),
+            ],
+            options={
+                'ordering': ['-score', '-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='products/')),
+                ('alt_text', models.CharField(blank=True, max_length=200)),
+                ('is_featured', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='images', to='store.product')),
+            ],
+            options={
+                'ordering': ['-is_featured', 'created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ProductComparison',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('session_key', models.CharField(blank=True, help_text='For anonymous users', max_length=255, null=True)),
+                ('name', models.CharField(default='Product Comparison', max_length=200)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='comparisons', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-updated_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='OrderItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(validators=[django.core.validators.MinValueValidator(1)])),
+                ('price_usd', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price_inr', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('order', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='store.order')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='store.product')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='LowStockAlert',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alert_level', models.CharField(choices=[('low', 'Low Stock'), ('critical', 'Critical Stock'), ('out_of_stock', 'Out of Stock')], max_length=20)),
+                ('threshold', models.PositiveIntegerField(help_text='Stock level that triggered this alert')),
+                ('current_stock', models.PositiveIntegerField()),
+                ('is_resolved', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('resolved_at', models.DateTimeField(blank=True, null=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='stock_alerts', to='store.product')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='InventoryMovement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('movement_type', models.CharField(choices=[('purchase', 'Purchase/Restock'), ('sale', 'Sale'), ('adjustment', 'Manual Adjustment'), ('return', 'Customer Return'), ('damage', 'Damaged/Lost'), ('transfer', 'Transfer')], max_length=20)),
+                ('quantity_change', models.IntegerField(help_text='Positive for stock increase, negative for decrease')),
+                ('stock_before', models.PositiveIntegerField(help_text='Stock level before this movement')),
+                ('stock_after', models.PositiveIntegerField(help_text='Stock level after this movement')),
+                ('reference_number', models.CharField(blank=True, help_text='Order ID, Invoice number, etc.', max_length=100)),
+                ('notes', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inventory_movements', to='store.product')),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CouponUsage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('usage_count', models.PositiveIntegerField(default=1, help_text='Number of times this user has used this coupon')),
+                ('last_used_at', models.DateTimeField(auto_now=True)),
+                ('coupon', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_usages', to='store.discountcoupon')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='coupon_usages', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Coupon Usage',
+                'verbose_name_plural': 'Coupon Usages',
+                'ordering': ['-last_used_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ComparisonItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('added_at', models.DateTimeField(auto_now_add=True)),
+                ('comparison', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='store.productcomparison')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='store.product')),
+            ],
+            options={
+                'ordering': ['added_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='CartItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('quantity', models.PositiveIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)])),
+                ('price_usd', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price_inr', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cart', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='store.cart')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='store.product')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='applied_coupon',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='carts', to='store.discountcoupon'),
+        ),
+        migrations.AddField(
+            model_name='cart',
+            name='user',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.CreateModel(
+            name='AnnouncementView',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ip_address', models.GenericIPAddressField()),
+                ('user_agent', models.TextField(blank=True)),
+                ('viewed_at', models.DateTimeField(auto_now_add=True)),
+                ('announcement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='announcement_views', to='store.siteannouncement')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Announcement View',
+                'verbose_name_plural': 'Announcement Views',
+            },
+        ),
+        migrations.CreateModel(
+            name='AnnouncementDismissal',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ip_address', models.GenericIPAddressField()),
+                ('dismissed_at', models.DateTimeField(auto_now_add=True)),
+                ('announcement', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dismissals', to='store.siteannouncement')),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Announcement Dismissal',
+                'verbose_name_plural': 'Announcement Dismissals',
+            },
+        ),
+        migrations.CreateModel(
+            name='AdminProfile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('avatar', models.ImageField(blank=True, null=True, upload_to='admin_avatars/')),
+                ('phone', models.CharField(blank=True, max_length=20)),
+                ('department', models.CharField(blank=True, max_length=100)),
+                ('bio', models.TextField(blank=True, help_text='Admin bio/description')),
+                ('theme_preference', models.CharField(choices=[('light', 'Light Theme'), ('dark', 'Dark Theme')], default='dark', max_length=10)),
+                ('dashboard_layout', models.JSONField(default=dict, help_text='Dashboard widget preferences')),
+                ('email_notifications', models.BooleanField(default=True)),
+                ('sms_notifications', models.BooleanField(default=False)),
+                ('two_factor_enabled', models.BooleanField(default=False)),
+                ('allowed_ip_addresses', models.TextField(blank=True, help_text='Comma-separated IP addresses')),
+                ('last_login_ip', models.GenericIPAddressField(blank=True, null=True)),
+                ('failed_login_attempts', models.PositiveIntegerField(default=0)),
+                ('locked_until', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('role', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='store.adminrole')),
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='admin_profile', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Admin Profile',
+                'verbose_name_plural': 'Admin Profiles',
+            },
+        ),
+        migrations.CreateModel(
+            name='AdminAnnouncement',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=200)),
+                ('message', models.TextField()),
+                ('announcement_type', models.CharField(choices=[('info', 'ℹ️ Information'), ('warning', '⚠️ Warning'), ('success', '✅ Success'), ('error', '❌ Error'), ('maintenance', '🔧 Maintenance')], default='info', max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('show_to_users', models.BooleanField(default=True, help_text='Show to regular users')),
+                ('show_to_admins', models.BooleanField(default=True, help_text='Show to admin users')),
+                ('is_dismissible', models.BooleanField(default=True, help_text='Can users dismiss this?')),
+                ('start_date', models.DateTimeField(blank=True, null=True)),
+                ('end_date', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('created_by', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Admin Announcement',
+                'verbose_name_plural': 'Admin Announcements',
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.CreateModel(
+            name='AdminActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('action_type', models.CharField(choices=[('login', '🔐 Login'), ('logout', '🚪 Logout'), ('create', '➕ Create'), ('update', '✏️ Update'), ('delete', '🗑️ Delete'), ('bulk_action', '🔄 Bulk Action'), ('export', '📤 Export'), ('import', '📥 Import'), ('email_blast', '📧 Email Blast'), ('maintenance', '🔧 Maintenance'), ('config_change', '⚙️ Config Change'), ('security_action', '🛡️ Security Action')], max_length=20)),
+                ('description', models.TextField()),
+                ('object_type', models.CharField(blank=True, help_text='Model name affected', max_length=100)),
+                ('object_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('object_repr', models.CharField(blank=True, help_text='String representation', max_length=200)),
+                ('ip_address', models.GenericIPAddressField(blank=True, null=True)),
+                ('user_agent', models.TextField(blank=True)),
+                ('additional_data', models.JSONField(default=dict, help_text='Extra data about the action')),
+                ('success', models.BooleanField(default=True)),
+                ('error_message', models.TextField(blank=True)),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+                ('admin_user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='admin_activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Admin Activity',
+                'verbose_name_plural': 'Admin Activities',
+                'ordering': ['-timestamp'],
+            },
+        ),
+        migrations.CreateModel(
+            name='WishlistItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('added_at', models.DateTimeField(auto_now_add=True)),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='store.product')),
+                ('wishlist', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='items', to='store.wishlist')),
+            ],
+            options={
+                'ordering': ['-added_at'],
+                'unique_together': {('wishlist', 'product')},
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='wishlist',
+            constraint=models.UniqueConstraint(condition=models.Q(('user__isnull', False)), fields=('user',), name='wishlist_user_unique'),
+        ),
+        migrations.AddConstraint(
+            model_name='wishlist',
+            constraint=models.UniqueConstraint(condition=models.Q(('session_key__isnull', False)), fields=('session_key',), name='wishlist_sess_unique'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='userproductinteraction',
+            unique_together={('user', 'product', 'interaction_type')},
+        ),
+        migrations.AddIndex(
+            model_name='searchquery',
+            index=models.Index(fields=['query'], name='store_searc_query_4d2b85_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchquery',
+            index=models.Index(fields=['created_at'], name='store_searc_created_e53cf9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='searchquery',
+            index=models.Index(fields=['results_count'], name='store_searc_results_b5c8a1_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='searchproductclick',
+            unique_together={('search_query', 'product')},
+        ),
+        migrations.AddIndex(
+            model_name='review',
+            index=models.Index(condition=models.Q(('is_approved', True)), fields=['product'], name='review_approved_prod_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='review',
+            unique_together={('product', 'user')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='producttagassignment',
+            unique_together={('product', 'tag')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='productspecification',
+            unique_together={('product', 'name')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='productslug',
+            unique_together={('product', 'slug')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='productrecommendation',
+            unique_together={('product', 'recommended_product', 'recommendation_type')},
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'available', '-created_at'], name='prod_cat_avail_created'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['category', 'available', '-featured', '-created_at'], name='prod_cat_avail_feat'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['available', 'featured', '-created_at'], name='prod_avail_feat_created'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['price'], name='store_produ_price_2d55a6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['brand'], name='store_produ_brand_aa2434_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['available', 'stock'], name='store_produ_availab_56ed7b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['created_at'], name='store_produ_created_5555f3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['color'], name='store_produ_color_4b4fa3_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['size'], name='store_produ_size_06907e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='product',
+            index=models.Index(fields=['avg_rating'], name='store_produ_avg_rat_a84689_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='lowstockalert',
+            unique_together={('product', 'alert_level')},
+        ),
+        migrations.AddIndex(
+            model_name='discountcoupon',
+            index=models.Index(fields=['coupon_code'], name='store_disco_coupon__dcc5eb_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discountcoupon',
+            index=models.Index(fields=['is_active', 'expiration_date'], name='store_disco_is_acti_3358ae_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='discountcoupon',
+            index=models.Index(fields=['created_at'], name='store_disco_created_13dd24_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='couponusage',
+            index=models.Index(fields=['user', '-last_used_at'], name='store_coupo_user_id_8c9ea6_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='couponusage',
+            index=models.Index(fields=['coupon', '-last_used_at'], name='store_coupo_coupon__d49623_idx'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='couponusage',
+            unique_together={('coupon', 'user')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='comparisonitem',
+            unique_together={('comparison', 'product')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='cartitem',
+            unique_together={('cart', 'product')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='announcementview',
+            unique_together={('announcement', 'user', 'ip_address')},
+        ),
+        migrations.AlterUniqueTogether(
+            name='announcementdismissal',
+            unique_together={('announcement', 'user', 'ip_address')},
+        ),
+        migrations.AddIndex(
+            model_name='adminactivity',
+            index=models.Index(fields=['admin_user', '-timestamp'], name='store_admin_admin_u_b66564_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='adminactivity',
+            index=models.Index(fields=['action_type', '-timestamp'], name='store_admin_action__df3386_idx'),
+        ),
+    ]
@@ -0,0 +1,56 @@
+from django.db import migrations
+
+from store.utils import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+    """
+    Keep Product.search_vector current with a BEFORE trigger and index it with
+    GIN (PostgreSQL only - elsewhere the column stays NULL and search falls
+    back to icontains).
+
+    The trigger rebuilds the vector in the row being written whenever an
+    indexed column is inserted or updated, so save(), bulk_create(),
+    bulk_update() and QuerySet.update() all keep it current, and writes that
+    don't touch those columns (e.g. save(update_fields=['stock'])) skip it.
+    """
+
+    dependencies = [
+        ('store', '0001_initial'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql=[
+                """
+                CREATE OR REPLACE FUNCTION store_product_search_vector() RETURNS trigger AS $$
+                BEGIN
+                    NEW.search_vector :=
+                        setweight(to_tsvector('simple', coalesce(NEW.name, '')), 'A')
+                        || setweight(to_tsvector('simple', coalesce(NEW.short_description, '')), 'B')
+                        || setweight(to_tsvector('simple', coalesce(NEW.description, '')), 'C')
+                        || setweight(to_tsvector('simple',
+                            coalesce(NEW.search_keywords, '') || ' ' || coalesce(NEW.brand, '')), 'D');
+                    RETURN NEW;
+                END
+                $$ LANGUAGE plpgsql
+                """,
+                'DROP TRIGGER IF EXISTS product_search_vector_update ON store_product',
+                """
+                CREATE TRIGGER product_search_vector_update
+                BEFORE INSERT OR UPDATE OF name, short_description, description, search_keywords, brand
+                ON store_product
+                FOR EACH ROW EXECUTE FUNCTION store_product_search_vector()
+                """,
+                'CREATE INDEX IF NOT EXISTS product_sv_gin ON store_product USING gin (search_vector)',
+                # Rows written before the trigger existed; a no-op write fires it
+                'UPDATE store_product SET name = name WHERE search_vector IS NULL',
+            ],
+            reverse_sql=[
+                'DROP INDEX IF EXISTS product_sv_gin',
+                'DROP TRIGGER IF EXISTS product_search_vector_update ON store_product',
+                'DROP FUNCTION IF EXISTS store_product_search_vector()',
+                'UPDATE store_product SET search_vector = NULL',
+            ],
+        ),
+    ]
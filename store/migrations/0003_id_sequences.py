@@ -0,0 +1,27 @@
+from django.db import migrations
+
+from store.utils import PostgreSQLRunSQL
+
+
+class Migration(migrations.Migration):
+    """
+    Sequences behind generated product SKUs and order ids (PostgreSQL only -
+    elsewhere next_sequence_value() returns None and random ids are used).
+    """
+
+    dependencies = [
+        ('store', '0002_product_search_vector'),
+    ]
+
+    operations = [
+        PostgreSQLRunSQL(
+            sql=[
+                'CREATE SEQUENCE IF NOT EXISTS product_sku_seq',
+                'CREATE SEQUENCE IF NOT EXISTS order_id_seq',
+            ],
+            reverse_sql=[
+                'DROP SEQUENCE IF EXISTS order_id_seq',
+                'DROP SEQUENCE IF EXISTS product_sku_seq',
+            ],
+        ),
+    ]
@@ -1,11 +1,16 @@
-from django.db import models
+from django.db import models, router
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils.text import slugify
 from django.core.validators import MinValueValidator, MaxValueValidator
+from django.contrib.postgres.search import SearchVectorField
+from django.db.models import Case, ExpressionWrapper, F, Q, Value, When
+from django.db.models.functions import Cast, Coalesce, Floor, NullIf
 from decimal import Decimal
 import uuid
 
+from .utils import next_sequence_value, ORDER_ID_SEQUENCE, SKU_SEQUENCE
+
 
 class Category(models.Model):
     # just product categories
@@ -34,6 +39,35 @@ class Category(models.Model):
         return reverse('store:category_detail', kwargs={'slug': self.slug})
 
 
+class ProductQuerySet(models.QuerySet):
+    def with_related(self):
+        """Category joined and images prefetched - what product cards and lists render"""
+        return self.select_related('category').prefetch_related('images')
+
+    def with_pricing(self, currency='INR'):
+        """Annotate discount_pct_<cur> and savings_<cur> so grids skip per-product Decimal maths"""
+        suffix = 'usd' if currency.upper() == 'USD' else 'inr'
+        price = F(f'price_{suffix}')
+        original = F(f'original_price_{suffix}')
+        on_sale = Q(**{f'original_price_{suffix}__gt': price})
+        price_field = models.DecimalField(max_digits=10, decimal_places=2)
+        return self.annotate(**{
+            f'discount_pct_{suffix}': Case(
+                When(on_sale, then=Cast(
+                    Floor((original - price) * 100 / original),
+                    output_field=models.IntegerField(),
+                )),
+                default=Value(0),
+                output_field=models.IntegerField(),
+            ),
+            f'savings_{suffix}': Case(
+                When(on_sale, then=ExpressionWrapper(original - price, output_field=price_field)),
+                default=Value(Decimal('0')),
+                output_field=price_field,
+            ),
+        })
+
+
 class Product(models.Model):
     # ecommerce products with dual pricing
     name = models.CharField(max_length=200)
@@ -85,8 +119,16 @@ class Product(models.Model):
     featured = models.BooleanField(default=False)
     main_image = models.ImageField(upload_to='products/', blank=True, null=True)
     
+    # Approved-review aggregates, denormalized so listings don't run AVG/COUNT
+    # per product; kept current by the Review signals in store.signals
+    avg_rating = models.DecimalField(max_digits=3, decimal_places=2, default=0)
+    review_count = models.PositiveIntegerField(default=0)
+    
     # Search-related fields
     search_keywords = models.TextField(blank=True, help_text="Additional keywords for search (comma-separated)")
+    # tsvector over name/descriptions/keywords/brand, GIN-indexed; only
+    # populated on PostgreSQL, by a trigger (see migration 0002_product_search_vector)
+    search_vector = SearchVectorField(null=True, editable=False)
     meta_title = models.CharField(max_length=200, blank=True, help_text="SEO title for search engines")
     meta_description = models.TextField(blank=True, help_text="SEO description for search engines")
     
@@ -106,19 +148,24 @@ class Product(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ProductQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['slug']),
-            models.Index(fields=['available']),
-            models.Index(fields=['featured']),
+            # composites follow the storefront access paths: equality filters
+            # first, then the listing sort (slug is already unique-indexed;
+            # available/featured alone are covered by the prefixes below)
+            models.Index(fields=['category', 'available', '-created_at'], name='prod_cat_avail_created'),
+            models.Index(fields=['category', 'available', '-featured', '-created_at'], name='prod_cat_avail_feat'),
+            models.Index(fields=['available', 'featured', '-created_at'], name='prod_avail_feat_created'),
             models.Index(fields=['price']),
             models.Index(fields=['brand']),
-            models.Index(fields=['category', 'available']),
             models.Index(fields=['available', 'stock']),
             models.Index(fields=['created_at']),
             models.Index(fields=['color']),
             models.Index(fields=['size']),
+            models.Index(fields=['avg_rating']),
         ]
     
     def __str__(self):
@@ -129,7 +176,9 @@ class Product(models.Model):
         if not self.slug:
             self.slug = slugify(self.name)
         if not self.sku:
-            self.sku = f"AMZ-{uuid.uuid4().hex[:8].upper()}"
+            # monotonic on PostgreSQL so bulk imports can't hit duplicate SKUs
+            n = next_sequence_value(SKU_SEQUENCE, using=router.db_for_write(Product, instance=self))
+            self.sku = f"AMZ-{n:08X}" if n is not None else f"AMZ-{uuid.uuid4().hex[:8].upper()}"
         super().save(*args, **kwargs)
     
     def get_absolute_url(self):
@@ -148,7 +197,10 @@ class Product(models.Model):
         return self.original_price_inr
     
     def get_discount_percentage(self, currency='INR'):
-        # calc discount %
+        # calc discount % - with_pricing() does this in SQL for whole lists
+        annotated = getattr(self, f'discount_pct_{currency.lower()}', None)
+        if annotated is not None:
+            return annotated
         current_price = self.get_price(currency)
         original_price = self.get_original_price(currency)
         
@@ -158,6 +210,10 @@ class Product(models.Model):
     
     def get_savings_amount(self, currency='INR'):
         # how much user saves
+        annotated = getattr(self, f'savings_{currency.lower()}', None)
+        if annotated is not None:
+            # sqlite hands computed decimals back unquantized
+            return annotated.quantize(Decimal('0.01'))
         current_price = self.get_price(currency)
         original_price = self.get_original_price(currency)
         
@@ -170,13 +226,12 @@ class Product(models.Model):
         return self.get_discount_percentage(currency) > 0
     
     def get_average_rating(self):
-        reviews = self.reviews.filter(is_approved=True)
-        if reviews.exists():
-            return round(reviews.aggregate(models.Avg('rating'))['rating__avg'], 1)
+        if self.review_count:
+            return float(round(self.avg_rating, 1))
         return 0
     
     def get_review_count(self):
-        return self.reviews.filter(is_approved=True).count()
+        return self.review_count
     
     def is_in_stock(self):
         return self.available and self.stock > 0
@@ -246,6 +301,10 @@ class Review(models.Model):
     class Meta:
         ordering = ['-created_at']
         unique_together = ['product', 'user']
+        indexes = [
+            # rating recomputes and product pages only read approved reviews
+            models.Index(fields=['product'], condition=Q(is_approved=True), name='review_approved_prod_idx'),
+        ]
     
     def __str__(self):
         return f"{self.product.name} - {self.rating} stars by {self.user.username}"
@@ -290,6 +349,12 @@ class UserProfile(models.Model):
         return ', '.join(filter(None, address_parts))
 
 
+# Output type and rounding for cart totals summed in the database
+CART_AMOUNT_FIELD = models.DecimalField(max_digits=12, decimal_places=2)
+CART_CENTS = Decimal('0.01')
+CART_TAX_RATE = Decimal('0.08')  # 8% tax
+
+
 class Cart(models.Model):
     CURRENCY_CHOICES = [
         ('INR', 'Indian Rupee (₹)'),
@@ -318,32 +383,79 @@ class Cart(models.Model):
             return f"Cart for {self.user.username}"
         return f"Anonymous Cart ({self.session_key[:8]}...)"
     
+    def _prefetched_items(self):
+        """Items already loaded via prefetch_related('items'), or None"""
+        return getattr(self, '_prefetched_objects_cache', {}).get('items')
+    
+    def _sum_items(self, line_total):
+        """SUM(line_total) over this cart's items, computed in the database"""
+        total = self.items.aggregate(
+            total=models.Sum(line_total, output_field=CART_AMOUNT_FIELD)
+        )['total']
+        return total.quantize(CART_CENTS) if total is not None else Decimal('0')
+    
     def get_total_price(self):
-        return sum(item.get_total_price() for item in self.items.all())
+        items = self._prefetched_items()
+        if items is not None:
+            return sum(item.get_total_price() for item in items)
+        # Same fallback as CartItem.get_total_price: price_usd, then price
+        return self._sum_items(
+            models.F('quantity') * Coalesce(NullIf('price_usd', Value(0)), 'price', Value(0))
+        )
     
     def get_total_items(self):
-        return sum(item.quantity for item in self.items.all())
+        items = self._prefetched_items()
+        if items is not None:
+            return sum(item.quantity for item in items)
+        return self.items.aggregate(total=models.Sum('quantity'))['total'] or 0
     
     def get_tax(self):
-        return self.get_total_price() * Decimal('0.08')  # 8% tax
+        return self.get_total_price() * CART_TAX_RATE
     
     def get_final_total(self):
-        return self.get_total_price() + self.get_tax()
+        subtotal = self.get_total_price()
+        return subtotal + subtotal * CART_TAX_RATE
     
     def get_total_price_in_currency(self, currency='USD'):
         """Get total price in specified currency"""
         # If currency not specified or empty, use cart's currency
         if not currency:
             currency = self.currency or 'USD'
-        return sum(item.get_total_price_in_currency(currency) for item in self.items.all())
+        items = self._prefetched_items()
+        if items is not None:
+            return sum(item.get_total_price_in_currency(currency) for item in items)
+        # Same fallback as CartItem.get_total_price_in_currency: the snapshot
+        # price, then the product's current price
+        field = 'price_inr' if currency.upper() == 'INR' else 'price_usd'
+        return self._sum_items(
+            models.F('quantity') * Coalesce(NullIf(field, Value(0)), f'product__{field}', Value(0))
+        )
     
     def get_tax_in_currency(self, currency='USD'):
         """Get tax amount in specified currency"""
-        return self.get_total_price_in_currency(currency) * Decimal('0.08')
+        return self.get_total_price_in_currency(currency) * CART_TAX_RATE
     
     def get_final_total_in_currency(self, currency='USD'):
         """Get final total (including tax) in specified currency"""
-        return self.get_total_price_in_currency(currency) + self.get_tax_in_currency(currency)
+        subtotal = self.get_total_price_in_currency(currency)
+        return subtotal + subtotal * CART_TAX_RATE
+    
+    def get_totals(self, currency=None):
+        """
+        Subtotal, tax, discount and final total from a single subtotal pass -
+        use this instead of calling the per-figure getters one after another.
+        Tax is charged on the pre-discount subtotal, as everywhere else.
+        """
+        currency = currency or self.currency or 'USD'
+        subtotal = self.get_total_price_in_currency(currency)
+        tax = subtotal * CART_TAX_RATE
+        discount = self.discount_amount or Decimal('0')
+        return {
+            'subtotal': subtotal,
+            'tax': tax,
+            'discount': discount,
+            'final': subtotal - discount + tax,
+        }
     
     def get_currency_symbol(self):
         """Get the currency symbol for this cart's currency"""
@@ -366,6 +478,37 @@ class Cart(models.Model):
         return total - self.discount_amount
 
 
+class CartItemQuerySet(models.QuerySet):
+    def bulk_add(self, cart, quantities):
+        """
+        Upsert several items into a cart in one INSERT ... ON CONFLICT.
+        quantities maps product id -> quantity (existing rows get that quantity);
+        price snapshots come from a single in_bulk() product fetch.
+        """
+        products = Product.objects.only('price_usd', 'price_inr', 'price').in_bulk(list(quantities))
+        items = []
+        for product_id, quantity in quantities.items():
+            product = products.get(product_id)
+            if product is None:
+                continue
+            price_usd = product.price_usd or Decimal('0')
+            price_inr = product.price_inr or Decimal('0')
+            items.append(self.model(
+                cart=cart,
+                product=product,
+                quantity=quantity,
+                price_usd=price_usd,
+                price_inr=price_inr,
+                price=price_usd or price_inr or product.price,
+            ))
+        return self.bulk_create(
+            items,
+            update_conflicts=True,
+            unique_fields=['cart', 'product'],
+            update_fields=['quantity', 'price_usd', 'price_inr', 'price', 'updated_at'],
+        )
+
+
 class CartItem(models.Model):
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE, related_name='items')
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
@@ -378,6 +521,8 @@ class CartItem(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = CartItemQuerySet.as_manager()
+    
     class Meta:
         unique_together = ['cart', 'product']
     
@@ -416,14 +561,20 @@ class CartItem(models.Model):
     def save(self, *args, **kwargs):
         # Capture dual-currency price snapshot at time of adding to cart
         # Always ensure both prices are set from product
-        if not self.price_usd:
-            self.price_usd = self.product.price_usd or Decimal('0')
-        if not self.price_inr:
-            self.price_inr = self.product.price_inr or Decimal('0')
-        
-        # Maintain backward compatibility
-        if not self.price:
-            self.price = self.price_usd or self.price_inr or self.product.price
+        if not self.price_usd or not self.price_inr or not self.price:
+            # use the product if it's already loaded, else fetch just its prices
+            if CartItem.product.is_cached(self):
+                product = self.product
+            else:
+                product = Product.objects.only('price_usd', 'price_inr', 'price').get(pk=self.product_id)
+            if not self.price_usd:
+                self.price_usd = product.price_usd or Decimal('0')
+            if not self.price_inr:
+                self.price_inr = product.price_inr or Decimal('0')
+            
+            # Maintain backward compatibility
+            if not self.price:
+                self.price = self.price_usd or self.price_inr or product.price
         
         super().save(*args, **kwargs)
 
@@ -503,7 +654,8 @@ class Order(models.Model):
     
     def save(self, *args, **kwargs):
         if not self.order_id:
-            self.order_id = f"AMZ{uuid.uuid4().hex[:10].upper()}"
+            n = next_sequence_value(ORDER_ID_SEQUENCE, using=router.db_for_write(Order, instance=self))
+            self.order_id = f"AMZ{n:010X}" if n is not None else f"AMZ{uuid.uuid4().hex[:10].upper()}"
         super().save(*args, **kwargs)
     
     def get_total_items(self):
@@ -608,10 +760,14 @@ class Wishlist(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
     
     class Meta:
-        unique_together = ['user', 'session_key']
-        indexes = [
-            models.Index(fields=['user']),
-            models.Index(fields=['session_key']),
+        # (user, session_key) pairs never collide when one side is NULL, so
+        # uniqueness is enforced per owner; the partial unique indexes also
+        # serve the get_or_create lookups in get_for_request
+        constraints = [
+            models.UniqueConstraint(fields=['user'], condition=Q(user__isnull=False), name='wishlist_user_unique'),
+            models.UniqueConstraint(
+                fields=['session_key'], condition=Q(session_key__isnull=False), name='wishlist_sess_unique'
+            ),
         ]
     
     def __str__(self):
@@ -1374,6 +1530,12 @@ class DiscountCoupon(models.Model):
     def __str__(self):
         return f"{self.coupon_code} - {self.get_discount_type_display()}"
     
+    def save(self, *args, **kwargs):
+        # Store codes in canonical form so lookups only normalize user input
+        if self.coupon_code:
+            self.coupon_code = self.coupon_code.strip().upper()
+        super().save(*args, **kwargs)
+    
     def is_valid(self):
         """Check if coupon is active, not expired, and under usage limit"""
         from django.utils import timezone
@@ -1,4 +1,4 @@
-from django.db.models import Count, Q, Avg, F
+from django.db.models import Count, Q, F
 from django.contrib.auth.models import User
 from .models import Product, ProductRecommendation, UserProductInteraction, Order, OrderItem, Review
 from collections import defaultdict
@@ -128,8 +128,6 @@ class RecommendationEngine:
                 filter=Q(orderitem__order__created_at__gte=thirty_days_ago)
             ),
             total_orders=Count('orderitem'),
-            avg_rating=Avg('reviews__rating'),
-            review_count=Count('reviews')
         ).order_by(
             '-recent_orders',
             '-total_orders',
@@ -182,7 +180,6 @@ class RecommendationEngine:
                 id__in=[p.id for p in wishlisted_products]
             ).annotate(
                 order_count=Count('orderitem'),
-                avg_rating=Avg('reviews__rating')
             ).order_by('-order_count', '-avg_rating')
             
             recommendations.extend(list(similar_products[:limit//2]))
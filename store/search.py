@@ -6,12 +6,14 @@ Handles product search, filtering, and relevance scoring
 from django.db.models import Q, F, Count, Avg, Case, When, IntegerField, Value, Min, Max
 from django.contrib.postgres.search import SearchVector, SearchQuery, SearchRank
 from django.core.paginator import Paginator
+from django.db import connections
 from django.utils import timezone
 from decimal import Decimal
 import re
 import operator
 from functools import reduce
 from .models import Product, Category, SearchQuery as SearchQueryModel, PopularSearch, ProductTag
+from .utils import SEARCH_CONFIG
 
 
 class SearchManager:
@@ -88,6 +90,7 @@ class SearchManager:
         
         # Build search conditions with different weights for different fields
         search_conditions = Q()
+        use_vector = connections[queryset.db].vendor == 'postgresql'
         
         for term in query_terms:
             term_condition = (
@@ -97,12 +100,8 @@ class SearchManager:
                 # Medium-high priority: starts with matches
                 Q(name__istartswith=term) |
                 Q(brand__istartswith=term) |
-                # Medium priority: contains matches
-                Q(name__icontains=term) |
-                Q(brand__icontains=term) |
-                Q(description__icontains=term) |
-                Q(short_description__icontains=term) |
-                Q(search_keywords__icontains=term) |
+                # Medium priority: contains / full-text matches
+                self._text_match(term, use_vector) |
                 Q(category__name__icontains=term) |
                 # Lower priority: specifications and tags
                 Q(specifications__value__icontains=term) |
@@ -118,6 +117,20 @@ class SearchManager:
         
         return queryset
     
+    def _text_match(self, term, use_vector):
+        """Match a term against the product's own text columns"""
+        if use_vector:
+            # GIN-indexed prefix match on the precomputed tsvector
+            prefix = ' & '.join(f'{word}:*' for word in re.findall(r'\w+', term))
+            return Q(search_vector=SearchQuery(prefix, search_type='raw', config=SEARCH_CONFIG))
+        return (
+            Q(name__icontains=term) |
+            Q(brand__icontains=term) |
+            Q(description__icontains=term) |
+            Q(short_description__icontains=term) |
+            Q(search_keywords__icontains=term)
+        )
+    
     def _add_relevance_score(self, queryset, query_terms):
         """Add relevance scoring to search results"""
         # First calculate base relevance score
@@ -207,11 +220,7 @@ class SearchManager:
         if min_rating:
             try:
                 min_rating = int(min_rating)
-                # This would need a subquery to calculate average rating
-                # For now, we'll use a simple approximation
-                queryset = queryset.annotate(
-                    avg_rating=Avg('reviews__rating')
-                ).filter(avg_rating__gte=min_rating)
+                queryset = queryset.filter(avg_rating__gte=min_rating)
             except (ValueError, TypeError):
                 pass
         
@@ -256,10 +265,7 @@ class SearchManager:
             return queryset.order_by('-price', 'name')
         elif sort_by == 'rating':
             # Sort by average rating, then by review count
-            return queryset.annotate(
-                avg_rating=Avg('reviews__rating'),
-                review_count=Count('reviews')
-            ).order_by('-avg_rating', '-review_count', 'name')
+            return queryset.order_by('-avg_rating', '-review_count', 'name')
         elif sort_by == 'newest':
             return queryset.order_by('-created_at', 'name')
         elif sort_by == 'oldest':
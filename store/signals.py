@@ -0,0 +1,56 @@
+"""
+Signal handlers for CartMax
+"""
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete, post_migrate
+from django.dispatch import receiver
+
+from .models import Review, Order, OrderItem, InventorySettings
+from .utils import (
+    invalidate_pending_review_count,
+    update_product_rating_stats,
+    backfill_product_rating_stats,
+    CUSTOMER_ANALYTICS_CACHE_KEY,
+    INVOICE_CACHE_KEY,
+    INVENTORY_SETTINGS_CACHE_KEY,
+)
+
+
+@receiver(post_save, sender=Review)
+@receiver(post_delete, sender=Review)
+def review_changed(sender, instance, **kwargs):
+    """Keep the pending-review count and the product's rating columns in sync"""
+    invalidate_pending_review_count()
+    update_product_rating_stats([instance.product_id])
+
+
+@receiver(post_save, sender=Order)
+@receiver(post_delete, sender=Order)
+def order_changed(sender, instance, **kwargs):
+    """Order totals and statuses feed the customer analytics dashboard and the invoice"""
+    cache.delete(CUSTOMER_ANALYTICS_CACHE_KEY)
+    cache.delete(INVOICE_CACHE_KEY.format(order_id=instance.pk))
+
+
+@receiver(post_save, sender=OrderItem)
+@receiver(post_delete, sender=OrderItem)
+def order_item_changed(sender, instance, **kwargs):
+    """Line items are rendered into the order's invoice"""
+    cache.delete(INVOICE_CACHE_KEY.format(order_id=instance.order_id))
+
+
+@receiver(post_save, sender=InventorySettings)
+@receiver(post_delete, sender=InventorySettings)
+def inventory_settings_changed(sender, instance, **kwargs):
+    """Stock thresholds are read from the cached settings row"""
+    cache.delete(INVENTORY_SETTINGS_CACHE_KEY)
+
+
+@receiver(post_migrate)
+def store_migrated(sender, using, **kwargs):
+    """
+    Data fix-up that lives outside the migrations: rating columns for reviews
+    written before they existed
+    """
+    if sender.name == 'store':
+        backfill_product_rating_stats(using=using)
@@ -0,0 +1,88 @@
+"""
+Background task helpers for CartMax
+Runs slow side effects (mostly email) off the request thread, best-effort:
+queued jobs are not persisted and failed jobs are not retried
+"""
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from django.db import connections, transaction
+import logging
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='cartmax-task')
+
+
+def _run_task(func, args, kwargs):
+    try:
+        return func(*args, **kwargs)
+    except Exception:
+        logger.exception(f"Background task {func.__name__} failed")
+    finally:
+        # Worker threads get their own DB connections; don't leak them
+        connections.close_all()
+
+
+def run_in_background(func, *args, **kwargs):
+    """
+    Queue func(*args, **kwargs) on the in-process worker pool and return immediately.
+
+    Submission waits for the surrounding transaction (if any) to commit, so a
+    task never sees - or reports on - rows that end up rolled back.
+
+    Delivery is best-effort. This is a thread pool, not a durable queue: jobs
+    live only in this process's memory, so anything not yet run is lost when
+    the worker process restarts, is recycled or is killed, and a task that
+    raises is logged once and never retried. Use it only for work that is
+    safe to drop (notification email, cache refreshes), and tell the user the
+    work was queued on a best-effort basis, never that it was done.
+    """
+    transaction.on_commit(partial(_executor.submit, _run_task, func, args, kwargs))
+
+
+# Tasks take primary keys, not model instances: the worker thread has its own
+# DB connection and should read current rows, not a stale copy from the request
+
+
+def send_order_confirmation_task(order_id):
+    """Re-fetch the order in the worker and send its confirmation email"""
+    from .emails import send_order_confirmation_email
+    from .models import Order
+
+    order = Order.objects.select_related('user').get(pk=order_id)
+    return send_order_confirmation_email(order)
+
+
+def send_low_stock_alerts_task(product_ids):
+    """Re-fetch the products in the worker and send their low stock alerts"""
+    from .emails import send_low_stock_alert_emails
+    from .models import Product
+
+    return send_low_stock_alert_emails(Product.objects.filter(pk__in=product_ids))
+
+
+def send_order_notification_task(order_id, status):
+    """Re-fetch the order in the worker and send a status notification"""
+    from .admin_views import send_order_notification
+    from .models import Order
+
+    order = Order.objects.select_related('user').get(pk=order_id)
+    return send_order_notification(order, status)
+
+
+def send_order_custom_email_task(order_id, message):
+    """Re-fetch the order in the worker and send a free-form message about it"""
+    from .admin_views import send_order_custom_email
+    from .models import Order
+
+    order = Order.objects.select_related('user').get(pk=order_id)
+    return send_order_custom_email(order, message)
+
+
+def send_bulk_customer_email_task(user_ids, subject, message):
+    """Re-fetch the customers in the worker and send them the same email"""
+    from django.contrib.auth.models import User
+    from .admin_views import send_bulk_customer_email
+
+    customers = User.objects.filter(pk__in=user_ids).only('id', 'username', 'first_name', 'last_name', 'email')
+    return send_bulk_customer_email(customers, subject, message)
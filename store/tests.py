@@ -1,3 +1,285 @@
-from django.test import TestCase
+import threading
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.test import SimpleTestCase, TestCase
+
+from .amazon_scraper import AmazonPriceScraper, SEARCH_PAGE_END_MARKER
+from .models import Cart, CartItem, Category, Order, OrderItem, Product, Review, Wishlist
+from .tasks import run_in_background, send_order_confirmation_task
+from .utils import INVOICE_CACHE_KEY, next_sequence_value, SKU_SEQUENCE
+
+
+class StoreTestCase(TestCase):
+    """Shared catalogue, created once per test class"""
+
+    @classmethod
+    def setUpTestData(cls):
+        category = Category.objects.create(name='Gadgets')
+        cls.phone = Product.objects.create(
+            name='Phone', description='Phone', category=category, stock=10,
+            price_usd=Decimal('19.99'), price_inr=Decimal('1650.50'),
+        )
+        cls.cable = Product.objects.create(
+            name='Cable', description='Cable', category=category, stock=10,
+            price_usd=Decimal('3.33'), price_inr=Decimal('275.00'),
+        )
+
+
+class ProductRatingStatsTests(StoreTestCase):
+    """avg_rating / review_count follow approved reviews through the Review signals"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.alice = User.objects.create_user('alice')
+        cls.bob = User.objects.create_user('bob')
+
+    def test_review_save_updates_stats(self):
+        Review.objects.create(product=self.phone, user=self.alice, rating=4, title='Good', comment='-')
+        Review.objects.create(product=self.phone, user=self.bob, rating=5, title='Great', comment='-')
+
+        self.phone.refresh_from_db()
+        self.assertEqual(self.phone.review_count, 2)
+        self.assertEqual(self.phone.get_average_rating(), 4.5)
+        self.assertIsInstance(self.phone.get_average_rating(), float)
+
+    def test_unapproved_reviews_are_ignored(self):
+        Review.objects.create(product=self.phone, user=self.alice, rating=4, title='Good', comment='-')
+        review = Review.objects.create(product=self.phone, user=self.bob, rating=1, title='Bad', comment='-')
+        review.is_approved = False
+        review.save()
+
+        self.phone.refresh_from_db()
+        self.assertEqual(self.phone.review_count, 1)
+        self.assertEqual(self.phone.get_average_rating(), 4.0)
+
+    def test_review_delete_updates_stats(self):
+        review = Review.objects.create(product=self.phone, user=self.alice, rating=3, title='Ok', comment='-')
+        review.delete()
+
+        self.phone.refresh_from_db()
+        self.assertEqual(self.phone.review_count, 0)
+        self.assertEqual(self.phone.get_average_rating(), 0)
+
+
+class CartTotalsTests(StoreTestCase):
+    """Database-summed cart totals match the per-item Python totals"""
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.cart = Cart.objects.create(currency='USD', discount_amount=Decimal('5.00'))
+        CartItem.objects.create(cart=cls.cart, product=cls.phone, quantity=3)
+        CartItem.objects.create(cart=cls.cart, product=cls.cable, quantity=2)
+
+    def python_total(self, currency):
+        items = CartItem.objects.filter(cart=self.cart).select_related('product')
+        return sum(item.get_total_price_in_currency(currency) for item in items)
+
+    def test_database_total_matches_item_totals(self):
+        for currency in ('USD', 'INR'):
+            with self.subTest(currency=currency):
+                self.assertEqual(self.cart.get_total_price_in_currency(currency), self.python_total(currency))
+        self.assertEqual(self.cart.get_total_price_in_currency('USD'), Decimal('66.63'))
+        self.assertEqual(self.cart.get_total_items(), 5)
+
+    def test_missing_snapshot_falls_back_to_product_price(self):
+        CartItem.objects.filter(product=self.cable).update(price_inr=0)
+
+        self.assertEqual(self.cart.get_total_price_in_currency('INR'), self.python_total('INR'))
+
+    def test_prefetched_items_give_the_same_total(self):
+        cart = Cart.objects.prefetch_related('items__product').get(pk=self.cart.pk)
+
+        with self.assertNumQueries(0):
+            total = cart.get_total_price_in_currency('USD')
+        self.assertEqual(total, self.cart.get_total_price_in_currency('USD'))
+
+    def test_get_totals(self):
+        totals = self.cart.get_totals()
+        subtotal = self.cart.get_total_price_in_currency('USD')
+
+        self.assertEqual(totals['subtotal'], subtotal)
+        self.assertEqual(totals['tax'], self.cart.get_tax_in_currency('USD'))
+        self.assertEqual(totals['discount'], Decimal('5.00'))
+        self.assertEqual(totals['final'], subtotal - Decimal('5.00') + totals['tax'])
+
+
+class CartItemBulkAddTests(StoreTestCase):
+    def setUp(self):
+        self.cart = Cart.objects.create()
+
+    def test_bulk_add_inserts_and_updates(self):
+        CartItem.objects.create(cart=self.cart, product=self.phone, quantity=1)
+
+        CartItem.objects.bulk_add(self.cart, {self.phone.pk: 4, self.cable.pk: 2})
+
+        items = {item.product_id: item for item in CartItem.objects.filter(cart=self.cart)}
+        self.assertEqual(len(items), 2)
+        self.assertEqual(items[self.phone.pk].quantity, 4)
+        self.assertEqual(items[self.cable.pk].quantity, 2)
+        self.assertEqual(items[self.cable.pk].price_usd, Decimal('3.33'))
+        self.assertEqual(items[self.cable.pk].price_inr, Decimal('275.00'))
+
+    def test_bulk_add_skips_unknown_products(self):
+        missing_id = self.cable.pk + 1000
+
+        CartItem.objects.bulk_add(self.cart, {self.phone.pk: 1, missing_id: 3})
+
+        self.assertEqual(
+            list(CartItem.objects.filter(cart=self.cart).values_list('product_id', flat=True)),
+            [self.phone.pk],
+        )
+
+
+class WishlistConstraintTests(TestCase):
+    """One wishlist per user and one per guest session"""
+
+    def test_one_wishlist_per_user(self):
+        user = User.objects.create_user('carol')
+        Wishlist.objects.create(user=user)
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Wishlist.objects.create(user=user)
+
+    def test_one_wishlist_per_session(self):
+        Wishlist.objects.create(session_key='guest-session')
+
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Wishlist.objects.create(session_key='guest-session')
+
+    def test_user_and_guest_wishlists_coexist(self):
+        Wishlist.objects.create(user=User.objects.create_user('dave'))
+        Wishlist.objects.create(user=User.objects.create_user('erin'))
+        Wishlist.objects.create(session_key='first-session')
+        Wishlist.objects.create(session_key='second-session')
+
+        self.assertEqual(Wishlist.objects.count(), 4)
+
+
+class SearchPageReadTests(SimpleTestCase):
+    """_read_search_page stops at the pagination widget and nowhere earlier"""
+
+    class StreamedResponse:
+        def __init__(self, chunks):
+            self.chunks = chunks
+            self.closed = False
+
+        def iter_content(self, chunk_size):
+            yield from self.chunks
+
+        def close(self):
+            self.closed = True
+
+    def read(self, chunks):
+        response = self.StreamedResponse(chunks)
+        content = AmazonPriceScraper()._read_search_page(response)
+        self.assertTrue(response.closed)
+        return content
+
+    def test_css_class_name_does_not_end_the_read(self):
+        content = self.read([b'<style>.s-pagination{}</style>', b'<div>results</div>', b'<footer>'])
+
+        self.assertEqual(content, b'<style>.s-pagination{}</style><div>results</div><footer>')
+
+    def test_marker_split_across_chunks_ends_the_read(self):
+        head, rest = SEARCH_PAGE_END_MARKER[:10], SEARCH_PAGE_END_MARKER[10:]
+
+        content = self.read([b'<div>results</div>' + head, rest + b'>', b'<div>ads</div>'])
+
+        self.assertEqual(content, b'<div>results</div>' + SEARCH_PAGE_END_MARKER + b'>')
+
+
+class ScraperSessionTests(SimpleTestCase):
+    def test_each_thread_gets_its_own_session(self):
+        scraper = AmazonPriceScraper()
+        sessions = []
+        worker = threading.Thread(target=lambda: sessions.append(scraper.session))
+        worker.start()
+        worker.join()
+
+        self.assertIs(scraper.session, scraper.session)
+        self.assertIsNot(sessions[0], scraper.session)
+        self.assertEqual(scraper.session.get_adapter('https://www.amazon.in').max_retries.total, 3)
+
+
+class BackgroundTaskTests(TestCase):
+    def test_tasks_are_submitted_on_commit(self):
+        with mock.patch('store.tasks._executor') as executor:
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                run_in_background(print, 'queued')
+                executor.submit.assert_not_called()
+
+        self.assertEqual(len(callbacks), 1)
+        executor.submit.assert_called_once()
+
+    def test_order_confirmation_task_reads_the_current_order(self):
+        order = Order.objects.create(
+            user=User.objects.create_user('frank'), email='old@example.com', total=Decimal('10.00'),
+        )
+        Order.objects.filter(pk=order.pk).update(email='new@example.com')
+
+        with mock.patch('store.emails.send_order_confirmation_email') as send:
+            send_order_confirmation_task(order.pk)
+
+        sent_order = send.call_args.args[0]
+        self.assertIsNot(sent_order, order)
+        self.assertEqual(sent_order.email, 'new@example.com')
+
+
+class GeneratedIdTests(StoreTestCase):
+    """SKUs and order ids come from sequences on PostgreSQL, random hex elsewhere"""
+
+    def create_order(self):
+        return Order.objects.create(user=User.objects.create_user('grace'), email='g@example.com', total=Decimal('1.00'))
+
+    def test_sqlite_has_no_sequences(self):
+        self.assertIsNone(next_sequence_value(SKU_SEQUENCE))
+
+    def test_fallback_ids_are_random_hex(self):
+        self.assertRegex(self.phone.sku, r'^AMZ-[0-9A-F]{8}$')
+        self.assertNotEqual(self.phone.sku, self.cable.sku)
+        self.assertRegex(self.create_order().order_id, r'^AMZ[0-9A-F]{10}$')
+
+    def test_sequence_values_are_zero_padded_hex(self):
+        with mock.patch('store.models.next_sequence_value', return_value=255):
+            product = Product.objects.create(
+                name='Case', description='Case', category=self.phone.category,
+                price_usd=Decimal('1.00'), price_inr=Decimal('80.00'),
+            )
+            order = self.create_order()
+
+        self.assertEqual(product.sku, 'AMZ-000000FF')
+        self.assertEqual(order.order_id, 'AMZ00000000FF')
+
+
+class InvoiceCacheTests(StoreTestCase):
+    """A cached invoice is dropped when the order or any of its items changes"""
+
+    def setUp(self):
+        self.order = Order.objects.create(
+            user=User.objects.create_user('heidi'), email='h@example.com', total=Decimal('19.99'),
+        )
+        self.item = OrderItem.objects.create(order=self.order, product=self.phone, quantity=1)
+        self.key = INVOICE_CACHE_KEY.format(order_id=self.order.pk)
+        cache.set(self.key, '<html>invoice</html>')
+
+    def test_item_change_drops_the_invoice(self):
+        self.item.quantity = 2
+        self.item.save()
+
+        self.assertIsNone(cache.get(self.key))
+
+    def test_item_delete_drops_the_invoice(self):
+        self.item.delete()
+
+        self.assertIsNone(cache.get(self.key))
+
+    def test_order_change_drops_the_invoice(self):
+        self.order.save()
+
+        self.assertIsNone(cache.get(self.key))
@@ -1,6 +1,35 @@
 """
 Utility functions for CartMax
 """
+from itertools import islice
+
+from django.core.cache import cache
+from django.db import migrations
+
+# Cache key for the pending-review badge shown in the admin review list
+PENDING_REVIEWS_CACHE_KEY = 'reviews:pending_count:v1'
+PENDING_REVIEWS_CACHE_TIMEOUT = 60
+
+# Cache key for the customer analytics dashboard payload
+CUSTOMER_ANALYTICS_CACHE_KEY = 'customer_analytics:v1'
+
+# Cache key for an order's rendered invoice, dropped by the Order / OrderItem
+# signals whenever the order or one of its items changes
+INVOICE_CACHE_KEY = 'invoice_html:{order_id}:v1'
+
+# Cache key for the global InventorySettings row
+INVENTORY_SETTINGS_CACHE_KEY = 'inventory_settings:v1'
+INVENTORY_SETTINGS_CACHE_TIMEOUT = 3600
+
+# Full-text search on PostgreSQL; 'simple' keeps prefix matching predictable.
+# Must match the config the search_vector trigger uses (migration 0002)
+SEARCH_CONFIG = 'simple'
+
+# PostgreSQL sequences behind generated product SKUs and order ids (created
+# by migration 0003)
+SKU_SEQUENCE = 'product_sku_seq'
+ORDER_ID_SEQUENCE = 'order_id_seq'
+
 
 def get_currency_by_country(country):
     """
@@ -13,19 +42,21 @@ def get_currency_by_country(country):
     return 'USD'
 
 
+# Fixed USD <-> INR rates, keyed by (from_currency, to_currency)
+EXCHANGE_RATES = {
+    ('USD', 'INR'): 83.0,  # 1 USD = 83 INR (can be updated)
+    ('INR', 'USD'): 1 / 83.0,  # 1 INR = 0.012 USD
+}
+
+
 def get_exchange_rate(from_currency='USD', to_currency='INR'):
     """
     Get exchange rate between two currencies.
     Currently uses fixed rates for USD ↔ INR conversion.
     Can be updated to fetch from API in future.
     """
-    rates = {
-        ('USD', 'INR'): 83.0,  # 1 USD = 83 INR (can be updated)
-        ('INR', 'USD'): 1 / 83.0,  # 1 INR = 0.012 USD
-    }
-    
     key = (from_currency.upper(), to_currency.upper())
-    return rates.get(key, 1.0)  # Default to 1.0 if no rate found
+    return EXCHANGE_RATES.get(key, 1.0)  # Default to 1.0 if no rate found
 
 
 def get_user_currency(user):
@@ -49,3 +80,123 @@ def get_user_currency(user):
         return get_currency_by_country(country)
     except:
         return 'USD'  # Fallback
+
+
+def get_request_currency(request):
+    """
+    get_user_currency() for the current request, computed once per request.
+    """
+    if not hasattr(request, '_user_currency'):
+        request._user_currency = get_user_currency(request.user)
+    return request._user_currency
+
+
+def chunked(iterable, size):
+    """
+    Yield lists of up to `size` items from any iterable.
+    Used to bound memory and per-batch work in bulk operations.
+    """
+    iterator = iter(iterable)
+    while True:
+        batch = list(islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+
+
+def get_pending_review_count():
+    """
+    Get the number of reviews awaiting moderation.
+    The count is cached briefly and invalidated whenever a review changes,
+    so admin page loads don't run a COUNT(*) on every request.
+    """
+    from .models import Review
+
+    return cache.get_or_set(
+        PENDING_REVIEWS_CACHE_KEY,
+        lambda: Review.objects.filter(is_approved=False).count(),
+        PENDING_REVIEWS_CACHE_TIMEOUT,
+    )
+
+
+def invalidate_pending_review_count():
+    """Drop the cached pending-review count so the next read recomputes it."""
+    cache.delete(PENDING_REVIEWS_CACHE_KEY)
+
+
+def get_inventory_settings():
+    """
+    Get the global inventory settings (inventory_manager.get_settings()).
+    The row is cached and invalidated whenever it is saved, so per-row admin
+    columns don't each run the get_or_create.
+    """
+    from .inventory import inventory_manager
+
+    return cache.get_or_set(
+        INVENTORY_SETTINGS_CACHE_KEY,
+        inventory_manager.get_settings,
+        INVENTORY_SETTINGS_CACHE_TIMEOUT,
+    )
+
+
+def update_product_rating_stats(product_ids, using='default'):
+    """
+    Recompute Product.avg_rating / review_count from approved reviews for the
+    given product ids (any iterable or values('pk') queryset) in one UPDATE.
+    """
+    from django.db.models import Avg, Count, DecimalField, OuterRef, Subquery, Value
+    from django.db.models.functions import Coalesce
+    from .models import Product, Review
+
+    approved = Review.objects.filter(product=OuterRef('pk'), is_approved=True).values('product')
+    Product.objects.using(using).filter(pk__in=product_ids).update(
+        avg_rating=Coalesce(
+            Subquery(approved.annotate(avg=Avg('rating')).values('avg')),
+            Value(0),
+            output_field=DecimalField(max_digits=3, decimal_places=2),
+        ),
+        review_count=Coalesce(Subquery(approved.annotate(count=Count('id')).values('count')), Value(0)),
+    )
+
+
+def next_sequence_value(name, using='default'):
+    """
+    nextval() of a PostgreSQL sequence, or None on other backends so callers
+    fall back to random identifiers.
+    """
+    from django.db import connections
+
+    connection = connections[using]
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT nextval(%s)', [name])
+        return cursor.fetchone()[0]
+
+
+def backfill_product_rating_stats(using='default'):
+    """
+    Fill the rating columns for products whose approved reviews predate them.
+    Only products still at review_count=0 that do have approved reviews are
+    touched, so repeat runs after the first are a cheap no-op.
+    """
+    from .models import Product
+
+    stale = Product.objects.using(using).filter(review_count=0, reviews__is_approved=True).values('pk')
+    update_product_rating_stats(stale, using=using)
+
+
+class PostgreSQLRunSQL(migrations.RunSQL):
+    """
+    RunSQL that only runs on PostgreSQL. For triggers, GIN indexes and
+    sequences that have no SQLite equivalent - other backends record the
+    migration as applied and carry on without them.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_forwards(app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == 'postgresql':
+            super().database_backwards(app_label, schema_editor, from_state, to_state)
@@ -9,10 +9,11 @@ from django.db import models
 from django.core.paginator import Paginator
 from django.contrib import messages
 from .models import *
-from .emails import send_order_confirmation_email, send_order_status_update_email
+from .emails import send_order_status_update_email
 from .recommendations import recommendation_engine
 from .inventory import inventory_manager
 from .search import search_manager
+from .tasks import run_in_background, send_order_confirmation_task
 from .utils import get_currency_by_country, get_user_currency
 import json
 from django.views.decorators.http import require_http_methods, require_POST
@@ -47,25 +48,26 @@ def homepage(request):
     # homepage with featured stuff - trying to make it faster
     
     # Get featured products - added prefetch to avoid n+1 queries
-    featured_products = Product.objects.filter(
+    # (ratings are stored on Product, so reviews no longer need prefetching)
+    featured_products = Product.objects.with_related().filter(
         featured=True, 
         available=True
-    ).select_related('category').prefetch_related('images', 'reviews')[:8]
+    )[:8]
     
     # deals section - products with original pricing
-    deals_products = Product.objects.filter(
+    deals_products = Product.objects.with_related().filter(
         available=True,
         original_price__isnull=False
-    ).select_related('category').prefetch_related('images')[:8]
+    )[:8]
     
     # recently viewed from session
     recently_viewed_ids = request.session.get('recently_viewed', [])
     recently_viewed = []
     if recently_viewed_ids:
-        recently_viewed = Product.objects.filter(
+        recently_viewed = Product.objects.with_related().filter(
             id__in=recently_viewed_ids,
             available=True
-        ).select_related('category').prefetch_related('images')[:6]
+        )[:6]
     
     # TODO: optimize these recommendation calls - they're slow
     popular_products = recommendation_engine.get_recommendations(
@@ -127,10 +129,10 @@ def category_detail(request, slug):
     category = get_object_or_404(Category, slug=slug, is_active=True)
     
     # Get products in this category
-    products_list = Product.objects.filter(
+    products_list = Product.objects.with_related().filter(
         category=category,
         available=True
-    ).select_related('category')
+    )
     
     # Handle sorting
     sort_by = request.GET.get('sort', 'featured')
@@ -206,10 +208,10 @@ def product_detail(request, slug):
         )
     
     # Get related products from the same category (fallback)
-    related_products = Product.objects.filter(
+    related_products = Product.objects.with_related().filter(
         category=product.category,
         available=True
-    ).exclude(id=product.id).select_related('category')[:8]
+    ).exclude(id=product.id)[:8]
     
     # Add to recently viewed session
     recently_viewed = request.session.get('recently_viewed', [])
@@ -438,9 +440,10 @@ def set_cart_currency(request):
         cart.save()
         
         # Return updated cart totals
-        subtotal = float(cart.get_total_price_in_currency(currency))
-        tax = float(cart.get_tax_in_currency(currency))
-        total = float(cart.get_final_total_in_currency(currency))
+        totals = cart.get_totals(currency)
+        subtotal = float(totals['subtotal'])
+        tax = float(totals['tax'])
+        total = subtotal + tax
         
         return JsonResponse({
             'success': True,
@@ -510,8 +513,9 @@ def add_to_cart(request, product_id):
                 recommendation_engine.track_interaction(request.user, product, 'cart')
             
             # Get complete cart data in the cart's currency
-            subtotal = float(cart.get_total_price_in_currency(cart.currency))
-            tax = float(cart.get_tax_in_currency(cart.currency))
+            totals = cart.get_totals(cart.currency)
+            subtotal = float(totals['subtotal'])
+            tax = float(totals['tax'])
             shipping = 0.00  # Free shipping
             total = subtotal + tax + shipping
             
@@ -585,8 +589,9 @@ def update_cart(request):
                     cart_item.save()
                     
                     # Get complete cart data in the cart's currency
-                    subtotal = float(cart.get_total_price_in_currency(cart.currency))
-                    tax = float(cart.get_tax_in_currency(cart.currency))
+                    totals = cart.get_totals(cart.currency)
+                    subtotal = float(totals['subtotal'])
+                    tax = float(totals['tax'])
                     shipping = 0.00  # Free shipping
                     total = subtotal + tax + shipping
                     
@@ -594,7 +599,7 @@ def update_cart(request):
                         'success': True,
                         'message': 'Cart updated successfully!',
                         'cart_count': cart.get_total_items(),
-                        'item_total': float(cart.get_total_price_in_currency(cart.currency)),
+                        'item_total': subtotal,
                         'subtotal': subtotal,
                         'tax': tax,
                         'shipping': shipping,
@@ -654,8 +659,9 @@ def remove_from_cart(request, product_id):
                     
                     # Get updated cart data after deletion in the cart's currency
                     cart_count = cart.get_total_items()
-                    subtotal = float(cart.get_total_price_in_currency(cart.currency))
-                    tax = float(cart.get_tax_in_currency(cart.currency))
+                    totals = cart.get_totals(cart.currency)
+                    subtotal = float(totals['subtotal'])
+                    tax = float(totals['tax'])
                     shipping = 0.00  # Free shipping
                     total = subtotal + tax + shipping
                     
@@ -716,8 +722,9 @@ def get_cart_totals(request):
             })
         
         # Get cart data in its current currency
-        subtotal = float(cart.get_total_price_in_currency(cart.currency))
-        tax = float(cart.get_tax_in_currency(cart.currency))
+        totals = cart.get_totals(cart.currency)
+        subtotal = float(totals['subtotal'])
+        tax = float(totals['tax'])
         shipping = 0.00  # Free shipping
         total = subtotal + tax + shipping
         
@@ -929,12 +936,10 @@ def checkout(request):
                 cart.items.all().delete()
                 cart.delete()
                 
-                # Send order confirmation email
-                try:
-                    send_order_confirmation_email(order)
-                except Exception as e:
-                    # Log error but don't fail the order
-                    print(f"Failed to send order confirmation email: {e}")
+                # Queue the order confirmation email off the request thread; it
+                # is submitted only once the order is committed, and the task
+                # logs failures, so they never fail the order
+                run_in_background(send_order_confirmation_task, order.pk)
                 
                 messages.success(request, f'Order #{order.id} placed successfully!')
                 return redirect('store:order_success', order_id=order.id)